@@ -24,13 +24,14 @@ import queue
 import threading
 import time
 import wave
-from collections import deque
+from collections.abc import Callable
 from typing import Any
 
 import numpy as np
 import sounddevice as sd
 import webrtcvad
 
+from fluentai.audio_utils import rms_int16
 from fluentai.database_logger import db_logger, get_device_name
 
 # Configure logging
@@ -53,35 +54,43 @@ class CircularAudioBuffer:
         self.buffer_duration = buffer_duration
         self.buffer_size = int(sample_rate * buffer_duration)
 
-        # Use deque for efficient circular buffer operations
-        self.buffer = deque(maxlen=self.buffer_size)
-        self.timestamps = deque(maxlen=self.buffer_size)
+        # Preallocated ring: samples/timestamps are written with slice copies
+        # and indexed modulo buffer_size (no per-sample Python work).
+        self.buffer = np.zeros(self.buffer_size, dtype=np.int16)
+        self.timestamps = np.zeros(self.buffer_size, dtype=np.float64)
+        self._written = 0  # Total samples ever added
         self.lock = threading.Lock()
 
         logger.info(
             f"Circular buffer initialized: {buffer_duration}s @ {sample_rate}Hz ({self.buffer_size} samples)"
         )
 
+    def __len__(self) -> int:
+        """Number of samples currently held (at most buffer_size)."""
+        return min(self._written, self.buffer_size)
+
     def add_samples(self, samples: np.ndarray, timestamp: float):
         """Add audio samples to the circular buffer."""
+        count = len(samples)
+        if count > self.buffer_size:
+            samples = samples[-self.buffer_size :]
+        n = len(samples)
         with self.lock:
-            for sample in samples:
-                self.buffer.append(sample)
-                self.timestamps.append(timestamp)
+            start = (self._written + count - n) % self.buffer_size
+            first = min(n, self.buffer_size - start)
+            self.buffer[start : start + first] = samples[:first]
+            self.buffer[: n - first] = samples[first:]
+            self.timestamps[start : start + first] = timestamp
+            self.timestamps[: n - first] = timestamp
+            self._written += count
 
     def get_samples(self, num_samples: int) -> tuple[np.ndarray, list]:
-        """Get the most recent samples from the buffer."""
+        """Get the most recent samples from the buffer (oldest first)."""
         with self.lock:
-            if len(self.buffer) < num_samples:
-                # Return all available samples
-                samples = np.array(list(self.buffer))
-                timestamps = list(self.timestamps)
-            else:
-                # Return last num_samples
-                samples = np.array(list(self.buffer)[-num_samples:])
-                timestamps = list(self.timestamps)[-num_samples:]
-
-            return samples, timestamps
+            num_samples = min(num_samples, len(self))
+            end = self._written % self.buffer_size
+            indices = np.arange(end - num_samples, end) % self.buffer_size
+            return self.buffer[indices], self.timestamps[indices].tolist()
 
     def get_duration_samples(self, duration: float) -> tuple[np.ndarray, list]:
         """Get samples for a specific duration from the end of the buffer."""
@@ -90,14 +99,12 @@ class CircularAudioBuffer:
 
     def get_all_samples(self) -> tuple[np.ndarray, list]:
         """Get all samples from the buffer."""
-        with self.lock:
-            return np.array(list(self.buffer)), list(self.timestamps)
+        return self.get_samples(self.buffer_size)
 
     def clear(self):
         """Clear the buffer."""
         with self.lock:
-            self.buffer.clear()
-            self.timestamps.clear()
+            self._written = 0
 
 
 class VADProcessor:
@@ -266,6 +273,8 @@ class AudioCaptureThread:
         max_blocking_ms: int = 50,
         mute_event: threading.Event | None = None,
         partial_interval_ms: int | None = None,
+        level_callback: Callable[[float], None] | None = None,
+        level_interval_ms: int = 50,
     ):
         """
         Initialize audio capture thread.
@@ -283,6 +292,9 @@ class AudioCaptureThread:
             silence_threshold_ms: Silence detection threshold in ms
             buffer_duration: Circular buffer duration in seconds
             max_blocking_ms: Maximum blocking time in ms
+            level_callback: Called from the audio thread with the RMS level
+                (0.0-1.0) of the incoming audio, for level meters.
+            level_interval_ms: Minimum interval between level_callback calls
         """
         self.asr_queue = asr_queue
         self.sample_rate = sample_rate
@@ -304,8 +316,10 @@ class AudioCaptureThread:
             silence_threshold_ms=silence_threshold_ms,
         )
 
-        # Recording state
-        self.current_recording = None
+        # Recording state: the utterance so far as a list of int16 frames,
+        # joined once when it is emitted.
+        self.current_recording: list[np.ndarray] | None = None
+        self._recording_len = 0
         self.recording_start_time = None
 
         # Streaming (partial) emission. When enabled, growing snapshots of the
@@ -320,6 +334,11 @@ class AudioCaptureThread:
         self.utterance_id = 0
         self._last_partial_len = 0
 
+        # Input level reporting (opt-in), throttled to level_interval_ms.
+        self.level_callback = level_callback
+        self.level_interval_s = level_interval_ms / 1000
+        self._last_level_time = 0.0
+
         # Thread control
         self.is_running = False
         self.thread = None
@@ -393,6 +412,12 @@ class AudioCaptureThread:
             else:
                 audio_data = (indata.flatten() * 32767).astype(np.int16)
 
+            if self.level_callback is not None:
+                now = time.monotonic()
+                if now - self._last_level_time >= self.level_interval_s:
+                    self._last_level_time = now
+                    self.level_callback(rms_int16(audio_data) / 32767)
+
             # Add to circular buffer
             timestamp = time.time()
             self.buffer.add_samples(audio_data, timestamp)
@@ -426,15 +451,16 @@ class AudioCaptureThread:
 
                 # Add frame to current recording if active
                 if self.current_recording is not None:
-                    self.current_recording.extend(frame)
+                    self.current_recording.append(frame)
+                    self._recording_len += len(frame)
 
                     # Emit a growing partial snapshot for streaming captions.
                     if self.partial_interval_samples and (
-                        len(self.current_recording) - self._last_partial_len
+                        self._recording_len - self._last_partial_len
                         >= self.partial_interval_samples
                     ):
                         self._emit_partial()
-                        self._last_partial_len = len(self.current_recording)
+                        self._last_partial_len = self._recording_len
 
         except Exception as e:
             logger.error(f"Error in audio callback: {e}")
@@ -447,7 +473,7 @@ class AudioCaptureThread:
         callback; dropped if the consumer queue is full.
         """
         try:
-            audio = np.array(self.current_recording, dtype=np.float32) / 32767.0
+            audio = np.concatenate(self.current_recording).astype(np.float32) / 32767.0
             self.asr_queue.put_nowait(
                 {
                     "audio": audio,
@@ -472,7 +498,8 @@ class AudioCaptureThread:
         pre_voice_samples, _ = self.buffer.get_duration_samples(0.2)
 
         # Initialize recording with pre-voice samples
-        self.current_recording = list(pre_voice_samples)
+        self.current_recording = [pre_voice_samples]
+        self._recording_len = len(pre_voice_samples)
         self.recording_start_time = time.time()
         self.utterance_id += 1
         self._last_partial_len = 0
@@ -489,7 +516,7 @@ class AudioCaptureThread:
 
         try:
             # Convert recording to numpy array
-            recording_array = np.array(self.current_recording)
+            recording_array = np.concatenate(self.current_recording)
 
             # Create WAV bytes
             wav_bytes = self._create_wav_bytes(recording_array)
@@ -634,7 +661,7 @@ class AudioCaptureThread:
                 "consecutive_silence_frames": self.vad.consecutive_silence_frames,
                 "is_recording": self.vad.is_recording,
             },
-            "buffer_size": len(self.buffer.buffer),
+            "buffer_size": len(self.buffer),
             "queue_size": self.asr_queue.qsize()
             if hasattr(self.asr_queue, "qsize")
             else -1,
@@ -2,7 +2,16 @@
 FluentAI: A lazy-loading AI model management package for translation and speech recognition.
 """
 
-from .model_loader import LazyModelLoader
-
 __version__ = "0.2.0"
 __all__ = ["LazyModelLoader"]
+
+
+def __getattr__(name):
+    # model_loader pulls in whisper, transformers and torch; import it only
+    # when LazyModelLoader is first used, so importing a light submodule
+    # (audio_utils, transcription, ...) or running ``--help`` stays fast.
+    if name == "LazyModelLoader":
+        from .model_loader import LazyModelLoader
+
+        return LazyModelLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
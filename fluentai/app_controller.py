@@ -13,6 +13,30 @@ logger = logging.getLogger(__name__)
 
 VALID_LANGUAGES = ("es", "en", "de", "fr")
 
+# Upper bound on generated tokens per sentence (Marian's model_max_length).
+_MAX_TRANSLATION_LENGTH = 512
+# Sentences per forward pass when translating a multi-sentence utterance.
+_TRANSLATION_BATCH_SIZE = 8
+
+# Default destination per source language when the user picks "auto".
+_AUTO_TARGETS = {"es": "en", "en": "es", "de": "es", "fr": "es"}
+
+# Supported (source, target) translation pairs.
+_VALID_PAIRS = frozenset(
+    {
+        ("es", "en"),
+        ("es", "de"),
+        ("es", "fr"),
+        ("en", "es"),
+        ("en", "de"),
+        ("en", "fr"),
+        ("de", "es"),
+        ("de", "en"),
+        ("fr", "es"),
+        ("fr", "en"),
+    }
+)
+
 # Latin character set used to sanity-check transcribed text (covers ES/DE/FR).
 _LATIN_CHARS = set(
     "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
@@ -110,24 +134,32 @@ class TranslationController:
     def translate(self, text, src_lang, dst_lang):
         """Translate text via the appropriate model. Returns text or None.
 
-        Multi-sentence input is split and translated sentence-by-sentence so the
-        model's max_length doesn't silently truncate longer utterances.
+        Multi-sentence input is split so the model's max_length doesn't silently
+        truncate longer utterances; the sentences go through the pipeline as one
+        padded batch rather than one forward pass each.
         """
         try:
             translator = self.model_loader.get_model(src_lang, dst_lang)
             if not translator:
                 logger.error("No translator for %s -> %s", src_lang, dst_lang)
                 return None
-            outputs = []
-            for sentence in self._split_sentences(text):
-                try:
-                    result = translator(sentence, max_length=512, do_sample=False)
-                except Exception as pipeline_error:
-                    logger.warning(
-                        "Translator call failed, retrying: %s", pipeline_error
-                    )
-                    result = translator(sentence)
-                outputs.append(result[0]["translation_text"].strip())
+            sentences = self._split_sentences(text)
+            tokenizer = getattr(translator, "tokenizer", None)
+            max_length = min(
+                _MAX_TRANSLATION_LENGTH,
+                getattr(tokenizer, "model_max_length", _MAX_TRANSLATION_LENGTH),
+            )
+            try:
+                results = translator(
+                    sentences,
+                    max_length=max_length,
+                    do_sample=False,
+                    batch_size=min(_TRANSLATION_BATCH_SIZE, len(sentences)),
+                )
+            except Exception as pipeline_error:
+                logger.warning("Translator call failed, retrying: %s", pipeline_error)
+                results = translator(sentences)
+            outputs = [r["translation_text"].strip() for r in results]
             return " ".join(o for o in outputs if o).strip()
         except Exception as e:
             logger.error("Translation error: %s", e)
@@ -145,19 +177,8 @@ class TranslationController:
     def determine_target_language(self, src_lang, target_selection):
         """Resolve the destination language from a selection (or 'auto')."""
         if target_selection == "auto":
-            if src_lang == "es":
-                return "en"
-            if src_lang in ("en", "de", "fr"):
-                return "es"
-            return "en"
-
-        valid_combinations = {
-            "es": ["en", "de", "fr"],
-            "en": ["es", "de", "fr"],
-            "de": ["es", "en"],
-            "fr": ["es", "en"],
-        }
-        if target_selection in valid_combinations.get(src_lang, []):
+            return _AUTO_TARGETS.get(src_lang, "en")
+        if (src_lang, target_selection) in _VALID_PAIRS:
             return target_selection
         return None
 
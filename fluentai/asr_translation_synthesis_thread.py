@@ -13,17 +13,37 @@ import queue
 import threading
 import time
 from collections.abc import Callable
+from typing import Any
 
 import whisper
 from transformers import pipeline
 
 from fluentai.database_logger import db_logger
+from fluentai.transcription import model_supports_fp16
 from fluentai.tts_engine import synthesize_to_numpy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Whisper models shared by every pipeline thread in the process, keyed by
+# model name, so restarting the pipeline doesn't reload the weights.
+_WHISPER_CACHE: dict[str, Any] = {}
+_WHISPER_CACHE_LOCK = threading.Lock()
+
+
+def _get_whisper_model(name: str):
+    """Load Whisper *name* once (on CUDA when available) and reuse it."""
+    with _WHISPER_CACHE_LOCK:
+        model = _WHISPER_CACHE.get(name)
+        if model is None:
+            import torch
+
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            model = whisper.load_model(name, device=device)
+            _WHISPER_CACHE[name] = model
+        return model
+
 
 class ASRTranslationSynthesisThread(threading.Thread):
     def __init__(
@@ -60,9 +80,7 @@ class ASRTranslationSynthesisThread(threading.Thread):
         """Load models in the thread context to avoid initialization issues."""
         try:
             logger.info(f"Loading Whisper model: {self.whisper_model_name}")
-            self.whisper_model = whisper.load_model(
-                self.whisper_model_name, device="cpu"
-            )
+            self.whisper_model = _get_whisper_model(self.whisper_model_name)
             logger.info("Whisper model loaded successfully")
 
             # Load translation pipeline if needed (if source and destination are different)
@@ -114,7 +132,9 @@ class ASRTranslationSynthesisThread(threading.Thread):
                     # Use the temporary file path with Whisper
                     # Specify source language to avoid detection issues
                     result = self.whisper_model.transcribe(
-                        temp_file_path, language=self.src_lang
+                        temp_file_path,
+                        language=self.src_lang,
+                        fp16=model_supports_fp16(self.whisper_model),
                     )
                     original_text = result["text"].strip()
                     logger.info(
@@ -5,13 +5,27 @@ previously duplicated as module-level functions in ``main_whisper.py`` and as
 methods on the ``FluentAIGUI`` class; this module is now the single source.
 """
 
+import functools
 import logging
+import math
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+def rms_int16(samples: np.ndarray) -> float:
+    """Root-mean-square of 16-bit PCM samples, in int16 units (0-32767).
+
+    A single vectorized dot product in float32; no per-sample Python work.
+    Returns 0.0 for empty input.
+    """
+    if samples.size == 0:
+        return 0.0
+    f = samples.astype(np.float32, copy=False).ravel()
+    return float(np.sqrt(np.dot(f, f) / f.size))
+
+
 def normalize_audio_rms(audio_data: bytes, target_rms: float = 0.2) -> bytes:
     """Normalize 16-bit PCM audio to a target RMS level for better ASR.
 
@@ -28,7 +42,7 @@ def normalize_audio_rms(audio_data: bytes, target_rms: float = 0.2) -> bytes:
         if audio_array.size == 0:
             return audio_data
 
-        current_rms = np.sqrt(np.mean(audio_array.astype(np.float32) ** 2))
+        current_rms = rms_int16(audio_array)
         if current_rms <= 0:
             return audio_data
 
@@ -74,3 +88,142 @@ def apply_automatic_gain_control(audio_data: bytes) -> bytes:
     except Exception as e:  # pragma: no cover - defensive fallback
         logger.warning("AGC failed: %s", e)
         return audio_data
+
+
+def _prepare_kernel(samples: np.ndarray, target_rms: float) -> np.ndarray:
+    """Scalar-loop form of ``prepare_for_whisper`` for JIT compilation.
+
+    One pass gathers the sum of squares and the peak; a second writes each
+    output sample with normalization, compression, gain and clipping fused.
+    Only used compiled: as plain Python it would be far slower than NumPy.
+    """
+    n = samples.size
+    out = np.empty(n, dtype=np.float32)
+    sum_sq = 0.0
+    max_abs = 0.0
+    for i in range(n):
+        v = float(samples[i])
+        sum_sq += v * v
+        max_abs = max(max_abs, abs(v))
+
+    scale = 1.0
+    if n > 0 and sum_sq > 0.0:
+        scale = (target_rms * 32767.0) / math.sqrt(sum_sq / n)
+    peak = math.trunc(min(max_abs * scale, 32767.0))
+    gain = peak * min(2.0, 16000.0 / (peak + 1.0))
+
+    for i in range(n):
+        v = math.trunc(min(max(samples[i] * scale, -32767.0), 32767.0))
+        if peak > 0.0:
+            mag = (abs(v) / peak) ** 0.7 * gain
+            mag = math.trunc(min(mag, 32767.0))
+            v = mag if v >= 0.0 else -mag
+        out[i] = v / 32768.0
+    return out
+
+
+@functools.cache
+def _prepare_jit():
+    """Compile ``_prepare_kernel`` with numba on first use, or None.
+
+    numba is optional and slow to import, so it is only loaded once audio is
+    actually processed; without it ``prepare_for_whisper`` uses NumPy.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True, fastmath=True, boundscheck=False)(_prepare_kernel)
+
+
+def prepare_for_whisper(audio_data: bytes, target_rms: float = 0.2) -> np.ndarray:
+    """Normalize and gain-control 16-bit PCM into Whisper's float32 input.
+
+    Same result as ``normalize_audio_rms`` followed by
+    ``apply_automatic_gain_control`` and scaling to [-1, 1], but every step
+    runs in place on a single float32 buffer instead of converting to and
+    from int16 bytes in between. With ``numba`` installed the whole chain is
+    one compiled two-pass loop (``_prepare_kernel``).
+
+    Args:
+        audio_data: Raw 16-bit PCM audio as bytes.
+        target_rms: Target RMS level in the range 0.0-1.0.
+
+    Returns:
+        Float32 samples in [-1, 1]. If processing fails the unprocessed audio
+        is returned.
+    """
+    kernel = _prepare_jit()
+    if kernel is not None:
+        return kernel(np.frombuffer(audio_data, dtype=np.int16), target_rms)
+
+    x = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+    try:
+        current_rms = rms_int16(x)
+        if current_rms > 0:
+            x *= (target_rms * 32767) / current_rms
+            np.clip(x, -32767, 32767, out=x)
+            np.trunc(x, out=x)
+
+        peak = float(max(x.max(), -x.min())) if x.size else 0.0
+        if peak > 0:
+            sign = np.sign(x)
+            np.abs(x, out=x)
+            x /= peak
+            np.power(x, 0.7, out=x)
+            x *= sign
+            x *= peak * min(2.0, 16000 / (peak + 1))
+            np.clip(x, -32767, 32767, out=x)
+            np.trunc(x, out=x)
+    except Exception as e:  # pragma: no cover - defensive fallback
+        logger.warning("Audio preprocessing failed: %s", e)
+        x = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+
+    x /= 32768.0
+    return x
+
+
+def trim_silence(
+    audio_data: bytes,
+    sample_rate: int,
+    threshold: float,
+    frame_ms: int = 20,
+    pad_ms: int = 250,
+) -> bytes:
+    """Cut leading and trailing silence from 16-bit PCM audio.
+
+    The audio is split into ``frame_ms`` frames and the per-frame RMS is
+    computed in one vectorized pass; everything before the first and after
+    the last frame above *threshold* is dropped, keeping ``pad_ms`` of margin
+    on each side so soft onsets and word endings survive.
+
+    Args:
+        audio_data: Raw 16-bit mono PCM audio as bytes.
+        sample_rate: Sample rate of *audio_data* in Hz.
+        threshold: Frame RMS (int16 units, as in ``rms_int16``) that counts
+            as sound.
+        frame_ms: Analysis frame length in milliseconds.
+        pad_ms: Margin kept around the voiced region in milliseconds.
+
+    Returns:
+        The trimmed audio as bytes; empty if no frame reaches *threshold*.
+    """
+    samples = np.frombuffer(audio_data, dtype=np.int16)
+    frame = max(1, sample_rate * frame_ms // 1000)
+    n_frames = -(-samples.size // frame)
+    if n_frames == 0:
+        return b""
+
+    padded = np.zeros(n_frames * frame, dtype=np.float32)
+    padded[: samples.size] = samples
+    frames = padded.reshape(n_frames, frame)
+    frame_rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)
+
+    voiced = np.flatnonzero(frame_rms >= threshold)
+    if voiced.size == 0:
+        return b""
+
+    pad = sample_rate * pad_ms // 1000
+    start = max(0, voiced[0] * frame - pad)
+    end = min(samples.size, (voiced[-1] + 1) * frame + pad)
+    return samples[start:end].tobytes()
@@ -99,14 +99,13 @@ class BlackHoleReproductionThread(threading.Thread):
                             if len(audio_chunk.shape) == 1:
                                 audio_chunk = audio_chunk.reshape(-1, 1)
 
-                            # Play audio in chunks to avoid buffer issues
+                            # Play audio in chunks to avoid buffer issues.
+                            # write() blocks until the device has room, which
+                            # already paces the loop; no sleep needed.
                             for i in range(0, len(audio_chunk), chunk_size):
                                 chunk = audio_chunk[i : i + chunk_size]
                                 if chunk.size > 0:
                                     stream.write(chunk)
-                                    time.sleep(
-                                        0.001
-                                    )  # Small delay to avoid overwhelming the buffer
 
                             logger.info(
                                 f"Played audio chunk: {len(audio_chunk)} samples"
@@ -143,8 +142,7 @@ class BlackHoleReproductionThread(threading.Thread):
                             if len(next_chunk.shape) == 1:
                                 next_chunk = next_chunk.reshape(-1, 1)
                             stream.write(next_chunk)
-                        else:
-                            time.sleep(0.01)  # Avoid busy waiting
+                        # Otherwise loop: get(timeout=0.1) already waits.
 
         except Exception as e:
             logger.error(f"Error in BlackHole playback thread: {e}")
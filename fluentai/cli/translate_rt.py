@@ -32,6 +32,7 @@ from fluentai.blackhole_reproduction_thread import BlackHoleReproductionThread
 
 # FluentAI imports
 from fluentai.model_loader import LazyModelLoader
+from fluentai.ring_queue import RingQueue
 
 # Check if audio_capture_thread is available
 try:
@@ -260,9 +261,9 @@ class RealTimeTranslator:
         # Initialize model loader
         self.model_loader = LazyModelLoader()
 
-        # Initialize queues
-        self.asr_queue = queue.Queue(maxsize=10)
-        self.output_queue = queue.Queue(maxsize=10)
+        # Initialize queues (one producer and one consumer each)
+        self.asr_queue = RingQueue(maxsize=10)
+        self.output_queue = RingQueue(maxsize=10)
 
         # Initialize stats overlay
         self.stats_overlay = StatsOverlay()
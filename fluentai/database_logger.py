@@ -7,13 +7,85 @@ operations across threads. It includes two main tables:
 2. translations - Summary records for complete translation sessions
 """
 
+import atexit
+import collections
+import json
 import threading
 import time
 import uuid
+from contextlib import contextmanager
+from datetime import datetime
 from typing import Any
 
 import duckdb
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# translation_logs and translations rows are buffered and written by a
+# background writer thread, every LOG_FLUSH_INTERVAL_S or as soon as
+# LOG_FLUSH_ROWS log rows are pending.
+LOG_FLUSH_ROWS = 256
+LOG_FLUSH_INTERVAL_S = 1.0
+# While the database can't be opened, unwritten rows wait in memory for the
+# next attempt; past this many per table the oldest are dropped.
+LOG_MAX_PENDING_ROWS = 64 * LOG_FLUSH_ROWS
+
+# The connection stays open while rows keep arriving and is closed, releasing
+# the file lock for other tools (view_database.py, a second GUI), only after
+# this long without any database use.
+DB_IDLE_CLOSE_S = 30.0
+
+# Applied to every connection, best effort (older DuckDB releases lack some).
+# The logger only runs small appends and lookups, so two worker threads are
+# plenty and leave the cores to audio capture and ASR; allocator housekeeping
+# moves to a background thread instead of running inside the pipeline's writes.
+# The connection stays open for a whole session (see DB_IDLE_CLOSE_S), so the
+# WAL grows across flushes; a larger threshold (default 16MB) means fewer
+# automatic checkpoints stalling a flush mid-session. Closing the idle
+# connection checkpoints whatever is left.
+_CONNECTION_SETTINGS = (
+    "SET threads = 2",
+    "SET allocator_background_threads = true",
+    "SET checkpoint_threshold = '64MB'",
+)
+
+# translation_logs rows kept in memory for get_session_activity.
+RECENT_LOG_ROWS = 32
+
+# Columns returned by get_recent_translations. session_id is stored as a UUID
+# but read back as text, like every session_id the logger hands out.
+_SUMMARY_COLUMNS = (
+    "id, session_id::VARCHAR AS session_id, timestamp, "
+    "input_language, output_language, full_message_input, "
+    "full_message_translated, total_latency_ms"
+)
+
+_INSERT_LOG_SQL = """
+    INSERT INTO translation_logs (
+        id, session_id, thread_id, timestamp, step_type, channel, message,
+        latency_ms, model_used, language, errors, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_TRANSLATION_SQL = """
+    INSERT INTO translations (
+        id, session_id, timestamp, input_language, output_language,
+        input_channel, output_channel, full_message_input,
+        full_message_translated, total_segments_audio, total_segments_asr,
+        total_segments_output, model_used, total_latency_ms, errors, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _dumps(value: Any) -> str:
+    """Serialize log metadata to JSON text (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(value, default=str).decode()
+    return json.dumps(value, default=str)
+
 
 class DatabaseLogger:
     """Thread-safe database logger for translation pipeline operations."""
@@ -26,75 +98,333 @@ class DatabaseLogger:
             db_path: Path to the DuckDB database file
         """
         self.db_path = db_path
+        # Guards the row buffer and ID counter; queries don't take it.
         self.lock = threading.Lock()
-        self._init_database()
+        # Held while a batch is being written, so flush() returns only once
+        # every row logged before the call is in the database.
+        self._flush_lock = threading.Lock()
+        # The database is opened on first use and kept open while it is in
+        # use; the writer closes it after DB_IDLE_CLOSE_S idle and at exit
+        # (see _connection). Each thread works through its own cursor (see
+        # _cursor) so pipeline threads don't serialize on the connection.
+        self._conn_lock = threading.Lock()
+        self._root = None
+        # Bumped on every open, so cursors from a closed connection are
+        # replaced; _cursors holds them all so close can release them.
+        self._generation = 0
+        self._cursors: list = []
+        self._users = 0
+        self._last_used = 0.0
+        self._schema_ready = False
+        # Set after a failed open, cleared by the next successful one, so an
+        # unavailable database is reported once rather than on every flush.
+        self._unavailable = False
+        self._local = threading.local()
+        self._last_id = 0
+        # translation_logs rows not yet written (see LOG_FLUSH_ROWS).
+        self._pending_logs: list[list] = []
+        self._pending_translations: list[list] = []
+        # Latest rows and per-session counts of everything logged by this
+        # process, so live views don't have to query the database.
+        self._recent_logs: collections.deque[list] = collections.deque(
+            maxlen=RECENT_LOG_ROWS
+        )
+        self._session_log_counts: dict[str, int] = {}
+        self._wake = threading.Event()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="db-log-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
 
-    def _init_database(self):
-        """Initialize the database and create tables if they don't exist."""
-        with self.lock:
+    def _next_id(self) -> int:
+        """Microsecond-timestamp row ID, kept unique for back-to-back inserts.
+
+        Must be called with ``self.lock`` held.
+        """
+        self._last_id = max(int(time.time() * 1000000), self._last_id + 1)
+        return self._last_id
+
+    def _open(self):
+        """Connect to the database, creating the schema on first use.
+
+        Returns None, after printing a warning, if the database can't be
+        opened (e.g. another process holds its lock); logging is best effort
+        and must never take the pipeline down. Must be called with
+        ``self._conn_lock`` held.
+        """
+        try:
             conn = duckdb.connect(self.db_path)
+        except duckdb.Error as e:
+            if not self._unavailable:
+                print(f"Warning: database logging unavailable ({e})")
+                self._unavailable = True
+            return None
+        for setting in _CONNECTION_SETTINGS:
             try:
-                # Create translation_logs table
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS translation_logs (
-                        id BIGINT PRIMARY KEY,
-                        session_id VARCHAR NOT NULL,
-                        thread_id INTEGER NOT NULL,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        step_type VARCHAR NOT NULL,
-                        channel VARCHAR,
-                        message TEXT,
-                        latency_ms FLOAT,
-                        model_used VARCHAR,
-                        language VARCHAR,
-                        errors VARCHAR[],
-                        metadata JSON
-                    )
-                """)
-
-                # Create translations table
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS translations (
-                        id BIGINT PRIMARY KEY,
-                        session_id VARCHAR NOT NULL,
-                        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        input_language VARCHAR NOT NULL,
-                        output_language VARCHAR NOT NULL,
-                        input_channel VARCHAR,
-                        output_channel VARCHAR,
-                        full_message_input TEXT,
-                        full_message_translated TEXT,
-                        total_segments_audio INTEGER DEFAULT 0,
-                        total_segments_asr INTEGER DEFAULT 0,
-                        total_segments_output INTEGER DEFAULT 0,
-                        model_used VARCHAR,
-                        total_latency_ms FLOAT,
-                        errors VARCHAR[],
-                        metadata JSON
-                    )
-                """)
-
-                # Create indexes for better query performance
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_translation_logs_session_id ON translation_logs(session_id)"
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_translation_logs_timestamp ON translation_logs(timestamp)"
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_translations_session_id ON translations(session_id)"
-                )
-                conn.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_translations_timestamp ON translations(timestamp)"
-                )
+                conn.execute(setting)
+            except duckdb.Error:
+                pass
+        if not self._schema_ready:
+            try:
+                self._init_database(conn)
+            except Exception:
+                conn.close()
+                self._unavailable = True
+                return None
+            self._schema_ready = True
+        self._unavailable = False
+        return conn
 
-                print(f"Database initialized successfully at {self.db_path}")
+    def _cursor(self):
+        """Return this thread's cursor on the open connection.
 
-            except Exception as e:
-                print(f"Error initializing database: {e}")
+        Must be called with ``self._conn_lock`` held and the connection open.
+        """
+        if getattr(self._local, "generation", None) != self._generation:
+            self._local.cursor = self._root.cursor()
+            self._local.generation = self._generation
+            self._cursors.append(self._local.cursor)
+        return self._local.cursor
+
+    @contextmanager
+    def _connection(self):
+        """Yield this thread's cursor, or None if the database can't be opened.
+
+        Opens the connection if it isn't open; it stays open for the next
+        caller until the writer finds it idle (see _close_if_idle).
+        """
+        with self._conn_lock:
+            if self._root is None:
+                self._root = self._open()
+                self._generation += 1
+            if self._root is None:
+                cursor = None
+            else:
+                cursor = self._cursor()
+                self._users += 1
+        try:
+            yield cursor
+        finally:
+            if cursor is not None:
+                with self._conn_lock:
+                    self._users -= 1
+                    self._last_used = time.monotonic()
+
+    def _close_connection(self):
+        """Close every cursor and the connection, releasing the file lock.
+
+        Must be called with ``self._conn_lock`` held and no users.
+        """
+        for cursor in self._cursors:
+            try:
+                cursor.close()
+            except duckdb.Error:
+                pass
+        self._cursors.clear()
+        try:
+            self._root.close()
+        except duckdb.Error as e:
+            print(f"Error closing database: {e}")
+        self._root = None
+
+    def _close_if_idle(self):
+        """Close the connection once nothing has used it for DB_IDLE_CLOSE_S."""
+        if self._pending_logs or self._pending_translations:
+            return
+        with self._conn_lock:
+            if (
+                self._root is not None
+                and self._users == 0
+                and time.monotonic() - self._last_used >= DB_IDLE_CLOSE_S
+            ):
+                self._close_connection()
+
+    def close(self):
+        """Write any buffered rows and close the connection (runs at exit)."""
+        self.flush()
+        with self._conn_lock:
+            if self._root is not None and self._users == 0:
+                self._close_connection()
+
+    @contextmanager
+    def bulk(self):
+        """Group all log writes made by this thread into one transaction.
+
+        Every write otherwise commits on its own; inside
+        ``with db_logger.bulk():`` this thread's writes share one transaction
+        and a single COMMIT at the end (rolled back if the block raises).
+        """
+        if getattr(self._local, "in_bulk", False):
+            yield  # Already inside a bulk block on this thread.
+            return
+        with self._connection() as cursor:
+            if cursor is None:
+                yield  # Database unavailable: rows are buffered as usual.
+                return
+            cursor.execute("BEGIN TRANSACTION")
+            self._local.in_bulk = True
+            self._local.bulk_rows = []
+            try:
+                yield
+                self._write_rows(cursor, _INSERT_LOG_SQL, self._local.bulk_rows)
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
                 raise
             finally:
-                conn.close()
+                self._local.in_bulk = False
+                self._local.bulk_rows = None
+
+    def flush(self):
+        """Write any buffered translation_logs rows to the database."""
+        with self._flush_lock:
+            with self.lock:
+                rows, self._pending_logs = self._pending_logs, []
+                translations = self._pending_translations
+                self._pending_translations = []
+            if not rows and not translations:
+                return
+            with self._connection() as cursor:
+                if cursor is None:
+                    # Database unavailable: retry on the writer's next tick.
+                    self._requeue(rows, translations)
+                    return
+                self._write_batch(cursor, _INSERT_LOG_SQL, rows)
+                self._write_batch(cursor, _INSERT_TRANSLATION_SQL, translations)
+
+    def _requeue(self, rows: list[list], translations: list[list]):
+        """Put an unwritten batch back in front of rows logged since."""
+        with self.lock:
+            self._pending_logs[:0] = rows
+            self._pending_translations[:0] = translations
+            dropped = 0
+            for pending in (self._pending_logs, self._pending_translations):
+                excess = len(pending) - LOG_MAX_PENDING_ROWS
+                if excess > 0:
+                    del pending[:excess]
+                    dropped += excess
+        if dropped:
+            print(f"Database unavailable; dropped {dropped} oldest log rows")
+
+    def _write_batch(self, cursor, sql: str, rows: list[list]):
+        """Write a flushed batch in one transaction, never raising.
+
+        A single bad row fails the whole ``executemany``; the batch is then
+        rolled back and retried row by row, so only the rows that can't be
+        inserted are lost. Called inside bulk() (a reader flushing on this
+        thread), the rows join that transaction instead and errors propagate.
+        """
+        if not rows:
+            return
+        if getattr(self._local, "in_bulk", False):
+            self._write_rows(cursor, sql, rows)
+            return
+        try:
+            cursor.execute("BEGIN TRANSACTION")
+            self._write_rows(cursor, sql, rows)
+            cursor.execute("COMMIT")
+            return
+        except Exception:
+            try:
+                cursor.execute("ROLLBACK")
+            except Exception:
+                pass
+        for row in rows:
+            try:
+                self._write_rows(cursor, sql, [row])
+            except Exception:
+                pass  # Already reported; only this row is dropped.
+
+    def _write_rows(self, cursor, sql: str, rows: list[list]):
+        """Insert ``rows`` on ``cursor``, serializing their metadata.
+
+        The buffered rows are left as they are (metadata still a dict), so a
+        batch can be written again after a failure.
+        """
+        if not rows:
+            return
+        rows = [[*row[:-1], _dumps(row[-1])] for row in rows]
+        try:
+            cursor.executemany(sql, rows)
+        except Exception as e:
+            print(f"Error writing log rows: {e}")
+            raise
+
+    def _writer_loop(self):
+        """Background thread: flush buffered rows off the pipeline threads."""
+        while True:
+            self._wake.wait(LOG_FLUSH_INTERVAL_S)
+            self._wake.clear()
+            try:
+                self.flush()
+                self._close_if_idle()
+            except Exception:
+                pass  # Already reported; keep the writer alive.
+
+    def _init_database(self, conn):
+        """Create the tables and indexes on ``conn`` if they don't exist."""
+        try:
+            # Create translation_logs table. session_id is a UUID (16
+            # bytes, not a 36-char string) and thread_id only holds 1-3.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translation_logs (
+                    id BIGINT PRIMARY KEY,
+                    session_id UUID NOT NULL,
+                    thread_id UTINYINT NOT NULL,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    step_type VARCHAR NOT NULL,
+                    channel VARCHAR,
+                    message TEXT,
+                    latency_ms FLOAT,
+                    model_used VARCHAR,
+                    language VARCHAR,
+                    errors VARCHAR[],
+                    metadata JSON
+                )
+            """)
+
+            # Create translations table
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translations (
+                    id BIGINT PRIMARY KEY,
+                    session_id UUID NOT NULL,
+                    timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    input_language VARCHAR NOT NULL,
+                    output_language VARCHAR NOT NULL,
+                    input_channel VARCHAR,
+                    output_channel VARCHAR,
+                    full_message_input TEXT,
+                    full_message_translated TEXT,
+                    total_segments_audio INTEGER DEFAULT 0,
+                    total_segments_asr INTEGER DEFAULT 0,
+                    total_segments_output INTEGER DEFAULT 0,
+                    model_used VARCHAR,
+                    total_latency_ms FLOAT,
+                    errors VARCHAR[],
+                    metadata JSON
+                )
+            """)
+
+            # Create indexes for better query performance
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translation_logs_session_id ON translation_logs(session_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translation_logs_timestamp ON translation_logs(timestamp)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translations_session_id ON translations(session_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translations_timestamp ON translations(timestamp)"
+            )
+
+            print(f"Database initialized successfully at {self.db_path}")
+
+        except Exception as e:
+            print(f"Error initializing database: {e}")
+            raise
 
     def log_audio_capture(
         self,
@@ -223,6 +553,9 @@ class DatabaseLogger:
         """
         Log a complete translation session.
 
+        Like the per-step logs, the row is buffered and written by the
+        background writer; readers call flush() first.
+
         Args:
             session_id: Unique session identifier
             input_language: Source language
@@ -239,44 +572,31 @@ class DatabaseLogger:
             errors: List of errors encountered
             metadata: Additional metadata
         """
+        row = [
+            None,  # id, assigned under the lock
+            session_id,
+            datetime.now(),
+            input_language,
+            output_language,
+            input_channel,
+            output_channel,
+            full_message_input,
+            full_message_translated,
+            total_segments_audio,
+            total_segments_asr,
+            total_segments_output,
+            model_used,
+            total_latency_ms,
+            errors or [],
+            metadata or {},
+        ]
         with self.lock:
-            conn = duckdb.connect(self.db_path)
-            try:
-                log_id = int(time.time() * 1000000)  # Microsecond timestamp as ID
-
-                conn.execute(
-                    """
-                    INSERT INTO translations (
-                        id, session_id, input_language, output_language, input_channel, output_channel,
-                        full_message_input, full_message_translated, total_segments_audio,
-                        total_segments_asr, total_segments_output, model_used, total_latency_ms,
-                        errors, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    [
-                        log_id,
-                        session_id,
-                        input_language,
-                        output_language,
-                        input_channel,
-                        output_channel,
-                        full_message_input,
-                        full_message_translated,
-                        total_segments_audio,
-                        total_segments_asr,
-                        total_segments_output,
-                        model_used,
-                        total_latency_ms,
-                        errors or [],
-                        metadata or {},
-                    ],
-                )
-
-            except Exception as e:
-                print(f"Error logging complete translation: {e}")
-                raise
-            finally:
-                conn.close()
+            row[0] = self._next_id()
+            if not getattr(self._local, "in_bulk", False):
+                self._pending_translations.append(row)
+                return
+        # Inside bulk(): write now, as part of this thread's transaction.
+        self._write_rows(self._local.cursor, _INSERT_TRANSLATION_SQL, [row])
 
     def _log_thread_activity(
         self,
@@ -294,6 +614,9 @@ class DatabaseLogger:
         """
         Internal method to log thread activity.
 
+        Rows are buffered and written in batches (see ``LOG_FLUSH_ROWS``);
+        readers of ``translation_logs`` flush first, and ``flush()`` runs at exit.
+
         Args:
             session_id: Unique session identifier
             thread_id: Thread identifier (1=capture, 2=asr/translation, 3=playback)
@@ -306,38 +629,117 @@ class DatabaseLogger:
             errors: List of errors
             metadata: Additional metadata
         """
+        row = [
+            None,  # id, assigned under the lock
+            session_id,
+            thread_id,
+            datetime.now(),
+            step_type,
+            channel,
+            message,
+            latency_ms,
+            model_used,
+            language,
+            errors or [],
+            metadata or {},
+        ]
         with self.lock:
-            conn = duckdb.connect(self.db_path)
+            row[0] = self._next_id()
+            self._recent_logs.append(row)
+            self._session_log_counts[session_id] = (
+                self._session_log_counts.get(session_id, 0) + 1
+            )
+            if getattr(self._local, "in_bulk", False):
+                # Written by bulk() inside its transaction.
+                self._local.bulk_rows.append(row)
+                return
+            self._pending_logs.append(row)
+            pending = len(self._pending_logs)
+        if pending >= LOG_FLUSH_ROWS:
+            self._wake.set()
+
+    def get_session_activity(
+        self, session_id: str, limit: int = 3
+    ) -> tuple[int, list[dict]]:
+        """
+        Get a session's log count and latest log rows from memory.
+
+        Only covers rows logged by this process (the latest RECENT_LOG_ROWS
+        across all sessions), but never touches the database, so it is cheap
+        enough to call on every dashboard frame.
+
+        Args:
+            session_id: Session identifier
+            limit: Maximum number of rows to return
+
+        Returns:
+            (number of rows logged for the session, up to ``limit`` latest
+            rows as dicts with timestamp, thread_id and message)
+        """
+        with self.lock:
+            total = self._session_log_counts.get(session_id, 0)
+            rows = [row for row in self._recent_logs if row[1] == session_id]
+        return total, [
+            {"timestamp": row[3], "thread_id": row[2], "message": row[6]}
+            for row in rows[-limit:]
+        ]
+
+    def get_session_stats(self, session_id: str) -> dict[int, tuple[int, int]]:
+        """
+        Count a session's logs and error logs per thread in one query.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Mapping of thread_id to (log count, count of logs with errors)
+        """
+        self.flush()
+        with self._connection() as conn:
+            if conn is None:
+                return {}
             try:
-                log_id = int(time.time() * 1000000)  # Microsecond timestamp as ID
+                result = conn.execute(
+                    "SELECT thread_id, COUNT(*), COUNT(*) FILTER (WHERE len(errors) > 0) "
+                    "FROM translation_logs WHERE session_id = ? GROUP BY thread_id",
+                    [session_id],
+                ).fetchall()
+                return {thread_id: (logs, errors) for thread_id, logs, errors in result}
 
-                conn.execute(
-                    """
-                    INSERT INTO translation_logs (
-                        id, session_id, thread_id, step_type, channel, message,
-                        latency_ms, model_used, language, errors, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    [
-                        log_id,
-                        session_id,
-                        thread_id,
-                        step_type,
-                        channel,
-                        message,
-                        latency_ms,
-                        model_used,
-                        language,
-                        errors or [],
-                        metadata or {},
-                    ],
-                )
+            except Exception as e:
+                print(f"Error getting session stats: {e}")
+                return {}
+
+    def get_session_errors(self, session_id: str, limit: int = 3) -> list[dict]:
+        """
+        Get a session's latest logs that recorded errors, oldest first.
+
+        Args:
+            session_id: Session identifier
+            limit: Maximum number of records to return
+
+        Returns:
+            List of dicts with timestamp, thread_id and errors
+        """
+        self.flush()
+        with self._connection() as conn:
+            if conn is None:
+                return []
+            try:
+                result = conn.execute(
+                    "SELECT timestamp, thread_id, errors FROM translation_logs "
+                    "WHERE session_id = ? AND len(errors) > 0 "
+                    "ORDER BY timestamp DESC, id DESC LIMIT ?",
+                    [session_id, limit],
+                ).fetchall()
+                columns = [desc[0] for desc in conn.description]
+                return [
+                    dict(zip(columns, row, strict=False)) for row in reversed(result)
+                ]
 
             except Exception as e:
-                print(f"Error logging thread activity: {e}")
-                raise
-            finally:
-                conn.close()
+                print(f"Error getting session errors: {e}")
+                return []
 
     def get_session_logs(self, session_id: str) -> list[dict]:
         """
@@ -349,11 +751,14 @@ class DatabaseLogger:
         Returns:
             List of log records
         """
-        with self.lock:
-            conn = duckdb.connect(self.db_path)
+        self.flush()
+        with self._connection() as conn:
+            if conn is None:
+                return []
             try:
                 result = conn.execute(
-                    "SELECT * FROM translation_logs WHERE session_id = ? ORDER BY timestamp",
+                    "SELECT * REPLACE (session_id::VARCHAR AS session_id) "
+                    "FROM translation_logs WHERE session_id = ? ORDER BY timestamp, id",
                     [session_id],
                 ).fetchall()
 
@@ -363,8 +768,6 @@ class DatabaseLogger:
             except Exception as e:
                 print(f"Error getting session logs: {e}")
                 return []
-            finally:
-                conn.close()
 
     def get_translation_summary(self, session_id: str) -> dict | None:
         """
@@ -376,11 +779,15 @@ class DatabaseLogger:
         Returns:
             Translation summary record or None
         """
-        with self.lock:
-            conn = duckdb.connect(self.db_path)
+        self.flush()
+        with self._connection() as conn:
+            if conn is None:
+                return None
             try:
                 result = conn.execute(
-                    "SELECT * FROM translations WHERE session_id = ? ORDER BY timestamp DESC LIMIT 1",
+                    "SELECT * REPLACE (session_id::VARCHAR AS session_id) "
+                    "FROM translations WHERE session_id = ? "
+                    "ORDER BY timestamp DESC LIMIT 1",
                     [session_id],
                 ).fetchone()
 
@@ -392,24 +799,28 @@ class DatabaseLogger:
             except Exception as e:
                 print(f"Error getting translation summary: {e}")
                 return None
-            finally:
-                conn.close()
 
     def get_recent_translations(self, limit: int = 10) -> list[dict]:
         """
         Get recent translation summaries.
 
+        Only the summary columns are read; DuckDB's column store skips the
+        rest (segment counts, errors, metadata) entirely.
+
         Args:
             limit: Maximum number of records to return
 
         Returns:
             List of recent translation records
         """
-        with self.lock:
-            conn = duckdb.connect(self.db_path)
+        self.flush()
+        with self._connection() as conn:
+            if conn is None:
+                return []
             try:
                 result = conn.execute(
-                    "SELECT * FROM translations ORDER BY timestamp DESC LIMIT ?",
+                    f"SELECT {_SUMMARY_COLUMNS} FROM translations "
+                    "ORDER BY timestamp DESC LIMIT ?",
                     [limit],
                 ).fetchall()
 
@@ -419,8 +830,6 @@ class DatabaseLogger:
             except Exception as e:
                 print(f"Error getting recent translations: {e}")
                 return []
-            finally:
-                conn.close()
 
     def cleanup_old_logs(self, days_to_keep: int = 30):
         """
@@ -429,8 +838,10 @@ class DatabaseLogger:
         Args:
             days_to_keep: Number of days to keep logs
         """
-        with self.lock:
-            conn = duckdb.connect(self.db_path)
+        self.flush()
+        with self._connection() as conn:
+            if conn is None:
+                return
             try:
                 # Delete old translation logs
                 conn.execute(
@@ -449,8 +860,6 @@ class DatabaseLogger:
             except Exception as e:
                 print(f"Error cleaning up logs: {e}")
                 raise
-            finally:
-                conn.close()
 
 
 # Global database logger instance
@@ -7,6 +7,7 @@ with LRU caching and async/threaded pre-loading capabilities.
 
 import asyncio
 import logging
+import os
 import threading
 
 # Suppress warnings for package deprecations only
@@ -26,6 +27,62 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Short input used to warm up a freshly loaded translation pipeline.
+_WARMUP_TEXT = "ok"
+
+
+def _translation_device() -> tuple[str, Any]:
+    """Pick the device and dtype for the translation pipelines.
+
+    MarianMT runs in float16 on a CUDA GPU. Everywhere else it stays on the
+    CPU in float32, which is the most compatible choice (bfloat16 is slower
+    than float32 on CPUs without native bf16 support).
+    """
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda:0", torch.float16
+    return "cpu", torch.float32
+
+
+class CTranslate2Translator:
+    """Callable stand-in for a HF translation pipeline backed by CTranslate2.
+
+    Accepts the same call shapes the app uses on ``pipeline("translation")``
+    (a string or a list of strings plus generation kwargs) and returns
+    ``[{"translation_text": ...}, ...]``. Decoding is greedy unless
+    ``num_beams`` is given.
+    """
+
+    def __init__(self, translator: Any, tokenizer: Any):
+        self.model = translator
+        self.tokenizer = tokenizer
+
+    def __call__(self, texts: str | list[str], **kwargs: Any) -> list[dict]:
+        if isinstance(texts, str):
+            texts = [texts]
+        max_length = kwargs.get("max_new_tokens") or kwargs.get("max_length") or 256
+        batch = [
+            self.tokenizer.convert_ids_to_tokens(self.tokenizer.encode(text))
+            for text in texts
+        ]
+        results = self.model.translate_batch(
+            batch,
+            beam_size=kwargs.get("num_beams", 1),
+            max_batch_size=kwargs.get("batch_size", 0),
+            max_decoding_length=max_length,
+        )
+        return [
+            {
+                "translation_text": self.tokenizer.decode(
+                    self.tokenizer.convert_tokens_to_ids(result.hypotheses[0]),
+                    skip_special_tokens=True,
+                )
+            }
+            for result in results
+        ]
+
+
 class LazyModelLoader:
     """
     A lazy-loading model manager that maintains an in-memory LRU cache of loaded models.
@@ -164,18 +221,23 @@ class LazyModelLoader:
             logger.info(f"Loading translation model: {model_id}")
             logger.info(f"Cache directory: {self.cache_dir}")
 
-            # Load the model with explicit device handling
-            import torch
+            device, dtype = _translation_device()
+            logger.info(f"Using device: {device} ({dtype})")
 
-            # Use CPU device for better compatibility
-            device = "cpu"
-            logger.info(f"Using device: {device}")
+            model = self._load_ctranslate2_model(src_lang, tgt_lang, model_id)
+            if model is None:
+                # Load the model with device specification
+                # Note: We don't pass cache_dir to pipeline as it can cause issues with model_kwargs
+                model = pipeline(
+                    "translation", model=model_id, device=device, torch_dtype=dtype
+                )
 
-            # Load the model with device specification
-            # Note: We don't pass cache_dir to pipeline as it can cause issues with model_kwargs
-            model = pipeline(
-                "translation", model=model_id, device=device, torch_dtype=torch.float32
-            )
+            # One tiny generation up front, so the first real sentence doesn't
+            # pay for CUDA context/kernel setup and allocator warm-up.
+            try:
+                model(_WARMUP_TEXT, max_length=8)
+            except Exception as e:
+                logger.warning(f"Warm-up for {model_key} failed: {e}")
 
             logger.info(f"Pipeline created successfully for {model_key}")
             logger.info(f"Model type: {type(model)}")
@@ -212,6 +274,51 @@ class LazyModelLoader:
             with self._loading_lock:
                 self._loading_status.pop(loading_key, None)
 
+    def _load_ctranslate2_model(
+        self, src_lang: str, tgt_lang: str, model_id: str
+    ) -> CTranslate2Translator | None:
+        """
+        Load an int8 CTranslate2 export of a translation model, if present.
+
+        Exports live in ``<cache_dir>/ct2/<src>-<tgt>`` and are created once with
+        ``ct2-transformers-converter --model <model_id> --quantization int8
+        --output_dir <dir>``. Returns None (use the PyTorch pipeline) when the
+        export or the optional ``ctranslate2`` package is missing.
+
+        Args:
+            src_lang: Source language code
+            tgt_lang: Target language code
+            model_id: Hugging Face model id, used for the tokenizer
+
+        Returns:
+            The CTranslate2-backed translator or None
+        """
+        model_dir = self.cache_dir / "ct2" / f"{src_lang}-{tgt_lang}"
+        if not model_dir.is_dir():
+            return None
+        try:
+            import ctranslate2
+        except ImportError:
+            logger.info(f"ctranslate2 not installed, ignoring {model_dir}")
+            return None
+
+        from transformers import AutoTokenizer
+
+        # int8 weights everywhere; on a GPU keep activations in fp16.
+        has_cuda = ctranslate2.get_cuda_device_count() > 0
+        compute_type = "int8_float16" if has_cuda else "int8"
+
+        logger.info(f"Loading CTranslate2 {compute_type} model from {model_dir}")
+        translator = ctranslate2.Translator(
+            str(model_dir),
+            device="auto",
+            compute_type=compute_type,
+            intra_threads=os.cpu_count() or 0,
+        )
+        return CTranslate2Translator(
+            translator, AutoTokenizer.from_pretrained(model_id)
+        )
+
     def _cache_translation_model(self, model_key: tuple[str, str], model: Any) -> None:
         """
         Cache a translation model with LRU eviction.
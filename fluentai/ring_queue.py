@@ -0,0 +1,88 @@
+"""
+Bounded single-producer/single-consumer queue for the audio pipeline.
+
+The capture -> ASR -> playback threads each hand items to exactly one
+consumer, so the mutex and condition variables of ``queue.Queue`` are not
+needed; ``RingQueue`` offers the subset of its API the pipeline uses.
+"""
+
+import collections
+import queue
+import threading
+import time
+
+
+class RingQueue:
+    """Bounded single-producer/single-consumer queue over a ``deque``.
+
+    Drop-in for the ``queue.Queue`` calls the pipeline threads make
+    (``put``/``put_nowait``/``get``/``get_nowait``/``qsize``/``empty``).
+    ``deque.append``/``popleft`` are atomic, so neither side takes a lock;
+    an Event only wakes a consumer that found the queue empty, and a second
+    one a producer that found it full. As with ``queue.Queue``, ``put`` waits
+    for space (up to ``timeout``) unless ``block`` is false, and raises
+    ``queue.Full`` only when it gives up. ``on_put``/``on_get`` are called with
+    the new size on the producer/consumer thread.
+    """
+
+    def __init__(self, maxsize, on_put=None, on_get=None):
+        self.maxsize = maxsize
+        self.on_put = on_put
+        self.on_get = on_get
+        self._items = collections.deque()
+        self._ready = threading.Event()
+        self._space = threading.Event()
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
+    def put(self, item, block=True, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(self._items) >= self.maxsize:
+            if not block:
+                raise queue.Full
+            # Clear before re-checking so a get() racing with us still
+            # leaves the event set.
+            self._space.clear()
+            if len(self._items) < self.maxsize:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Full
+            self._space.wait(remaining)
+        self._items.append(item)
+        self._ready.set()
+        if self.on_put:
+            self.on_put(len(self._items))
+
+    def put_nowait(self, item):
+        self.put(item, block=False)
+
+    def get(self, block=True, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                item = self._items.popleft()
+            except IndexError:
+                if not block:
+                    raise queue.Empty from None
+                # Clear before re-checking so a put() racing with us still
+                # leaves the event set.
+                self._ready.clear()
+                if self._items:
+                    continue
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty from None
+                self._ready.wait(remaining)
+                continue
+            self._space.set()
+            if self.on_get:
+                self.on_get(len(self._items))
+            return item
+
+    def get_nowait(self):
+        return self.get(block=False)
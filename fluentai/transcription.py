@@ -8,14 +8,191 @@ class. This single implementation covers both via keyword options:
 - ``min_duration``: clips below this (seconds) are skipped and return empty text.
 - ``transcribe_options``: extra kwargs passed to ``model.transcribe`` on the
   whole-file / short-audio / fallback paths (e.g. ``word_timestamps=True``).
-  Per-chunk transcription intentionally uses only the language hint, matching
-  the original behavior of both callers.
+  Chunks instead use fixed anti-looping options (plus ``fp16`` when given):
+  each chunk is decoded independently, so conditioning on previous text only
+  spreads errors.
 """
 
 import os
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 EMPTY_LANGUAGE_DEFAULT = "es"
+TARGET_SAMPLE_RATE = 16000
+
+# Per-chunk Whisper params that curb hallucinated loops and near-silent chunks.
+_CHUNK_OPTIONS = {
+    "condition_on_previous_text": False,
+    "temperature": 0.0,
+    "compression_ratio_threshold": 2.4,
+    "no_speech_threshold": 0.6,
+}
+
+# Chunks decoded per batched encoder/decoder pass (openai-whisper models).
+_CHUNK_BATCH_SIZE = 8
+# openai-whisper's default: below this avg log-prob a no-speech chunk is dropped.
+_LOGPROB_THRESHOLD = -1.0
+
+# A trailing n-gram (n <= this many words) repeated this often is a loop.
+_MAX_REPEAT_NGRAM = 10
+_MIN_REPEATS = 3
+
+
+def _drop_repeated_tail(text):
+    """Collapse a trailing run of a repeated n-gram down to one occurrence.
+
+    Whisper occasionally gets stuck emitting the same phrase over and over at
+    the end of a chunk; keep the first copy and drop the rest.
+    """
+    words = text.split()
+    for n in range(1, _MAX_REPEAT_NGRAM + 1):
+        tail = words[-n:]
+        repeats = 1
+        while (
+            len(words) >= n * (repeats + 1)
+            and words[-n * (repeats + 1) : -n * repeats] == tail
+        ):
+            repeats += 1
+        if repeats >= _MIN_REPEATS:
+            return " ".join(words[: len(words) - n * (repeats - 1)])
+    return text
+
+
+def model_supports_fp16(model):
+    """Return True if *model* runs on a GPU, where half precision pays off.
+
+    Whisper places models on CUDA when available; on CPU ``fp16=True`` only
+    triggers a warning and a fallback to FP32, so it is requested only on GPU.
+    """
+    device = getattr(model, "device", None)
+    return getattr(device, "type", "cpu") == "cuda"
+
+
+# openai-whisper options that faster-whisper does not accept.
+_FASTER_WHISPER_IGNORED = ("fp16", "verbose")
+
+
+class _FasterWhisperModel:
+    """Wrap a ``faster_whisper.WhisperModel`` behind openai-whisper's API.
+
+    ``transcribe`` returns the same ``{"text", "language", "segments"}`` dict as
+    ``whisper.Whisper.transcribe`` so callers need not know which backend is in
+    use. Decoding is greedy (``beam_size=1``), matching openai-whisper's default.
+    """
+
+    def __init__(self, model, num_workers=1):
+        self.model = model
+        # Concurrent transcribe() calls that run in parallel (one per worker).
+        self.num_workers = num_workers
+
+    def transcribe(self, audio, **kwargs):
+        for key in _FASTER_WHISPER_IGNORED:
+            kwargs.pop(key, None)
+        kwargs.setdefault("beam_size", 1)
+        segments, info = self.model.transcribe(audio, **kwargs)
+        segments = [
+            {"start": seg.start, "end": seg.end, "text": seg.text} for seg in segments
+        ]
+        return {
+            "text": "".join(seg["text"] for seg in segments),
+            "language": info.language,
+            "segments": segments,
+        }
+
+
+def load_faster_whisper(model_size, device="auto", compute_type=None, num_workers=2):
+    """Load *model_size* with the CTranslate2 backend, or None if unavailable.
+
+    ``faster-whisper`` is optional; int8 weights roughly halve memory and run
+    several times faster than the PyTorch model on CPU. *compute_type*
+    defaults to ``int8_float16`` when a CUDA device is present (int8 weights,
+    fp16 activations on tensor cores) and ``int8`` otherwise. The cores are split
+    between *num_workers* workers sharing the weights, so long audio can
+    transcribe that many chunks at once without oversubscribing the CPU.
+    """
+    try:
+        import ctranslate2
+        from faster_whisper import WhisperModel
+    except ImportError:
+        return None
+    if compute_type is None:
+        has_cuda = ctranslate2.get_cuda_device_count() > 0
+        compute_type = "int8_float16" if has_cuda else "int8"
+    cpu_threads = max(1, (os.cpu_count() or 1) // num_workers)
+    model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
+    return _FasterWhisperModel(model, num_workers=num_workers)
+
+
+def _load_audio_16k(audio_file):
+    """Decode an audio file to mono float32 at 16 kHz.
+
+    Uses libsndfile directly; inputs already at 16 kHz (the capture rate used
+    throughout the app) skip resampling entirely. An in-memory array is taken
+    to be mono float32 at 16 kHz already and is returned as is.
+    """
+    if hasattr(audio_file, "ndim"):
+        return audio_file, TARGET_SAMPLE_RATE
+
+    import soundfile as sf
+
+    data, sr = sf.read(audio_file, dtype="float32", always_2d=False)
+    if data.ndim == 2:
+        data = data.mean(axis=1)
+    if sr != TARGET_SAMPLE_RATE:
+        from scipy.signal import resample_poly
+
+        data = resample_poly(data, TARGET_SAMPLE_RATE, sr).astype("float32")
+        sr = TARGET_SAMPLE_RATE
+    return data, sr
+
+
+def _decode_chunks_batched(model, chunks, language, chunk_options):
+    """Decode ≤30 s chunks through an openai-whisper model in padded batches.
+
+    ``transcribe`` runs the encoder once per chunk; stacking the chunks' mels
+    lets each encoder/decoder step cover up to ``_CHUNK_BATCH_SIZE`` chunks.
+    Chunks decode greedily at temperature 0 with no timestamps, matching
+    ``_CHUNK_OPTIONS`` (which never triggers ``transcribe``'s temperature
+    fallback); chunks ``transcribe`` would skip as silence come back empty.
+
+    Returns a list of ``{"text", "language"}`` dicts in chunk order.
+    """
+    import torch
+    import whisper
+
+    options = whisper.DecodingOptions(
+        language=language,
+        temperature=chunk_options["temperature"],
+        without_timestamps=True,
+        fp16=chunk_options.get("fp16", model_supports_fp16(model)),
+    )
+    results = []
+    for start in range(0, len(chunks), _CHUNK_BATCH_SIZE):
+        mels = torch.stack(
+            [
+                whisper.log_mel_spectrogram(
+                    whisper.pad_or_trim(chunk), model.dims.n_mels, device=model.device
+                )
+                for chunk in chunks[start : start + _CHUNK_BATCH_SIZE]
+            ]
+        )
+        for decoded in whisper.decode(model, mels, options):
+            silent = (
+                decoded.no_speech_prob > chunk_options["no_speech_threshold"]
+                and decoded.avg_logprob < _LOGPROB_THRESHOLD
+            )
+            results.append(
+                {
+                    "text": "" if silent else decoded.text,
+                    "language": decoded.language,
+                }
+            )
+    return results
 
 
 def transcribe_long_audio(
@@ -31,7 +208,8 @@ def transcribe_long_audio(
 
     Args:
         model: A loaded Whisper model exposing ``.transcribe()``.
-        audio_file: Path to the audio file (read at 16 kHz).
+        audio_file: Path to the audio file (read at 16 kHz), or a mono float32
+            array already at 16 kHz.
         language: Language code, or ``None`` to auto-detect.
         chunk_length: Chunk size in seconds for long audio.
         min_duration: Skip transcription for clips shorter than this (seconds).
@@ -45,9 +223,7 @@ def transcribe_long_audio(
     options = transcribe_options or {}
 
     try:
-        import librosa
-
-        audio, sr = librosa.load(audio_file, sr=16000)
+        audio, sr = _load_audio_16k(audio_file)
         audio_duration = len(audio) / sr
         print(f"Audio duration: {audio_duration:.2f} seconds")
 
@@ -64,46 +240,49 @@ def transcribe_long_audio(
         if audio_duration <= chunk_length:
             return model.transcribe(audio_file, **lang_kwargs, **options)
 
-        # Long audio: transcribe in chunks.
+        # Long audio: transcribe in chunks. The first chunk's detected language
+        # stands in for the whole file, so auto-detect needs no extra pass.
         texts = []
+        first_language = None
         chunk_size = int(chunk_length * sr)
-        for i in range(0, len(audio), chunk_size):
-            chunk = audio[i : i + chunk_size]
-
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_chunk:
-                chunk_filename = temp_chunk.name
-                import soundfile as sf
-
-                sf.write(chunk_filename, chunk, sr)
-                try:
-                    chunk_result = model.transcribe(chunk_filename, **lang_kwargs)
-                    texts.append(chunk_result["text"])
-                    print(f"Chunk {len(texts)}: '{chunk_result['text']}'")
-                finally:
-                    try:
-                        os.unlink(chunk_filename)
-                    except Exception:
-                        pass
+        chunk_options = dict(_CHUNK_OPTIONS)
+        if "fp16" in options:
+            chunk_options["fp16"] = options["fp16"]
+        # Slices are views into the decoded audio: no copy, no temp WAV.
+        chunks = [audio[i : i + chunk_size] for i in range(0, len(audio), chunk_size)]
+        if hasattr(model, "decode") and hasattr(model, "dims"):
+            chunk_results = _decode_chunks_batched(
+                model, chunks, language, chunk_options
+            )
+        else:
+            workers = min(len(chunks), getattr(model, "num_workers", 1))
+            # map() keeps chunk order; the backend releases the GIL.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                chunk_results = list(
+                    executor.map(
+                        lambda chunk: model.transcribe(
+                            chunk, **lang_kwargs, **chunk_options
+                        ),
+                        chunks,
+                    )
+                )
+        for chunk_result in chunk_results:
+            texts.append(_drop_repeated_tail(chunk_result["text"]))
+            if first_language is None:
+                first_language = chunk_result.get("language")
+            print(f"Chunk {len(texts)}: '{texts[-1]}'")
 
         combined_text = " ".join(texts).strip()
 
-        # Determine the result language: use the forced one, else detect it.
-        result_language = language or EMPTY_LANGUAGE_DEFAULT
-        if language is None:
-            try:
-                first_chunk_result = model.transcribe(audio_file, language=None)
-                result_language = first_chunk_result["language"]
-            except Exception:
-                pass
-
         return {
             "text": combined_text,
-            "language": result_language,
+            "language": language or first_language or EMPTY_LANGUAGE_DEFAULT,
             "segments": [],  # Could be enhanced to combine per-chunk segments.
         }
 
-    except ImportError:
-        print("Warning: librosa not available, falling back to regular transcription")
+    except ImportError as e:
+        # soundfile, scipy, or (batched chunks) whisper/torch is missing.
+        print(f"Warning: {e}; falling back to regular transcription")
         return model.transcribe(audio_file, **lang_kwargs, **options)
     except Exception as e:
         print(f"Error in chunked transcription: {e}")
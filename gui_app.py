@@ -1,10 +1,11 @@
-import os
+import functools
+import logging
 import queue
-import tempfile
 import threading
 import time
 import tkinter as tk
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox, scrolledtext, ttk
 
 import numpy as np
@@ -14,13 +15,13 @@ import speech_recognition as sr
 from audio_capture_thread import AudioCaptureThread
 from fluentai import audio_setup
 from fluentai.app_controller import TranslationController
-from fluentai.audio_utils import apply_automatic_gain_control, normalize_audio_rms
+from fluentai.audio_utils import prepare_for_whisper
 from fluentai.blackhole_reproduction_thread import BlackHoleReproductionThread
 from fluentai.meeting_detector import MicMonitor
 from fluentai.meeting_pipeline import MeetingSpeakThread
 from fluentai.model_loader import LazyModelLoader
 from fluentai.streaming_asr import StreamingTranscriber
-from fluentai.transcription import transcribe_long_audio
+from fluentai.transcription import model_supports_fp16, transcribe_long_audio
 from fluentai.tts_engine import speak_to_device, synthesize_to_numpy
 from fluentai.ui import theme
 from fluentai.ui.meeting_overlay import MeetingOverlay
@@ -29,11 +30,50 @@ from silence_detector import (
     create_silence_detector,
 )
 
+logger = logging.getLogger(__name__)
+
 # Suppress specific warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="librosa")
 
+TTS_SAMPLE_RATE = 44100
+
+# Smallest mic level change worth redrawing the level meter for.
+MIC_LEVEL_EPSILON = 0.02
+# Scales capture RMS (speech is typically 0.02-0.2) onto the 0-1 meter.
+MIC_LEVEL_GAIN = 5.0
+# Number of pre-generated simulated mic levels.
+MIC_NOISE_SIZE = 1024
+
+# message_queue polling interval while messages are flowing / while idle.
+MESSAGE_POLL_BUSY_MS = 33
+MESSAGE_POLL_IDLE_MS = 150
+
+# Message types that fully overwrite their widget, so only the latest counts.
+_COALESCED_MESSAGES = frozenset(
+    {
+        "status",
+        "progress_value",
+        "original_text",
+        "translated_text",
+        "listening_indicator",
+    }
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _synthesize_cached(text, lang):
+    """Synthesize *text* once per (text, lang); replays reuse the samples."""
+    return synthesize_to_numpy(text, lang, sample_rate=TTS_SAMPLE_RATE)
+
 
 class FluentAIGUI:
+    # Whisper options for whole-utterance transcription (fp16 is per device).
+    _FULL_TRANSCRIBE_OPTS = {
+        "word_timestamps": True,
+        "temperature": 0.0,
+        "condition_on_previous_text": True,
+    }
+
     def __init__(self, root):
         self.root = root
         self.root.title("🌍 Fluent AI - Bidirectional Translator")
@@ -49,11 +89,22 @@ class FluentAIGUI:
         self.is_listening = False
         self.is_processing = False
         self.microphone_level = 0.0
+        self._last_mic_level = -1.0
+        self._mic_simulation_active = False
+        # True while update_mic_level_display is scheduled (see _start_mic_display).
+        self._mic_display_active = False
+        # Pre-generated levels for the simulated meter, cycled through per tick.
+        self._mic_noise = np.random.default_rng().uniform(0.1, 0.8, MIC_NOISE_SIZE)
+        self._mic_noise_index = 0
+        self._mic_level_bar = None
         self.current_model_status = "No model loaded"
 
         # Cola para comunicación entre hilos
         self.message_queue = queue.Queue()
 
+        # Pool compartido para cargas de modelos y reproducción (one-shot work)
+        self._bg = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fluentai-gui")
+
         # Configurar reconocedor de voz para capturar frases más largas
         self.recognizer = sr.Recognizer()
         # Reducir el umbral de energía para ser más sensible a voz baja
@@ -144,9 +195,6 @@ class FluentAIGUI:
         # Iniciar el monitoreo de la cola de mensajes
         self.check_message_queue()
 
-        # Iniciar simulación de nivel de micrófono
-        self.simulate_microphone_level()
-
         # Pre-warm Whisper and the default translation model in background threads
         # so the first recording doesn't trigger a 10-30s freeze
         self.load_whisper_model()
@@ -326,7 +374,7 @@ class FluentAIGUI:
         theme.style_primary_button(self.meeting_toggle_btn)
 
         # Inicializar la actualización del medidor de micrófono
-        self.update_mic_level_display()
+        self._start_mic_display()
 
     def _build_silence_controls(self):
         # Frame para configuración de detección de silencio
@@ -597,17 +645,10 @@ class FluentAIGUI:
             self.status_lower_frame, variable=self.progress_var, maximum=100, length=300
         )
 
-        # Spinner para mostrar carga de modelos
-        self.spinner_label = tk.Label(
-            self.status_lower_frame,
-            text="",
-            font=("Arial", 10),
-            bg="#34495e",
-            fg="yellow",
+        # Spinner para mostrar carga de modelos (animado por Tk, sin callbacks)
+        self.spinner_bar = ttk.Progressbar(
+            self.status_lower_frame, mode="indeterminate", length=60
         )
-        self.spinner_active = False
-        self.spinner_chars = ["◐", "◓", "◑", "◒"]
-        self.spinner_index = 0
 
     def get_direction_from_display(self, display_text):
         """Convierte el texto de display a la clave de dirección"""
@@ -801,159 +842,90 @@ class FluentAIGUI:
         except Exception as e:
             print(f"Failed to log translation to DB: {e}")
 
+    def _transcribe_full(self, audio_file, src_lang):
+        """Transcribe audio_file (a path or 16 kHz float32 array) with the GUI's
+        Whisper settings.
+
+        src_lang is a language code, or "auto" to let Whisper detect it.
+        """
+        options = dict(
+            self._FULL_TRANSCRIBE_OPTS,
+            fp16=model_supports_fp16(self.current_whisper_model),
+        )
+        return transcribe_long_audio(
+            self.current_whisper_model,
+            audio_file,
+            language=None if src_lang == "auto" else src_lang,
+            min_duration=0.5,
+            transcribe_options=options,
+        )
+
     def process_with_whisper(self, audio, src_lang):
         """Procesa el audio con Whisper con configuración mejorada"""
         try:
-            print("\n=== INICIO DE PROCESO WHISPER ===")
-
-            # Guardar audio en archivo temporal con procesamiento mejorado
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
-                temp_filename = temp_audio.name
-
-                # Get complete WAV data (includes headers)
-                wav_data = audio.get_wav_data()
-
-                # Write the original WAV file first
-                with open(temp_filename, "wb") as f:
-                    f.write(wav_data)
-
-                # Now read it back properly, process it, and save it again
-                try:
-                    import soundfile as sf
-
-                    # Read the audio data properly
-                    audio_array, sample_rate = sf.read(temp_filename)
-
-                    # Convert to int16 format for processing if needed
-                    if audio_array.dtype != np.int16:
-                        audio_array = (audio_array * 32767).astype(np.int16)
-
-                    # Apply audio normalization using RMS for better Whisper recognition
-                    print("Aplicando normalización de audio...")
-                    normalized_audio = normalize_audio_rms(
-                        audio_array.tobytes(), target_rms=0.2
-                    )
+            logger.debug("=== INICIO DE PROCESO WHISPER ===")
 
-                    # Apply automatic gain control for consistency across microphones
-                    print("Aplicando control automático de ganancia...")
-                    processed_audio = apply_automatic_gain_control(normalized_audio)
-
-                    # Convert back to numpy array and save properly
-                    processed_array = np.frombuffer(processed_audio, dtype=np.int16)
-
-                    # Save the processed audio back to the file with proper WAV format
-                    sf.write(temp_filename, processed_array, sample_rate)
-
-                    print(f"Audio guardado en: {temp_filename}")
-                    print(
-                        f"Tamaño del archivo de audio: {os.path.getsize(temp_filename)} bytes"
-                    )
-
-                except ImportError:
-                    print(
-                        "Warning: soundfile not available, using original audio without processing"
-                    )
-                    # Just use the original WAV data
-                    with open(temp_filename, "wb") as f:
-                        f.write(wav_data)
-                    print(f"Audio guardado en: {temp_filename}")
-                    print(f"Tamaño del archivo de audio: {len(wav_data)} bytes")
-
-                except Exception as e:
-                    print(
-                        f"Warning: Audio processing failed: {e}, using original audio"
-                    )
-                    # Fall back to original WAV data
-                    with open(temp_filename, "wb") as f:
-                        f.write(wav_data)
-                    print(f"Audio guardado en: {temp_filename}")
-                    print(f"Tamaño del archivo de audio: {len(wav_data)} bytes")
-
-            # Verificar que el archivo existe
-            if os.path.exists(temp_filename):
-                print(
-                    f"Archivo temporal creado correctamente: {os.path.getsize(temp_filename)} bytes"
-                )
-            else:
-                print("ERROR: El archivo temporal no se creó")
-                return None, None
+            # PCM de 16 bits a 16 kHz en memoria: sin WAV temporal que escribir,
+            # releer y reescribir antes de que Whisper lo decodifique otra vez
+            raw_audio = audio.get_raw_data(convert_rate=16000, convert_width=2)
+            # Normalización RMS + AGC en una sola pasada sobre un buffer float32
+            logger.debug("Aplicando normalización y control automático de ganancia...")
+            pcm = prepare_for_whisper(raw_audio, target_rms=0.2)
 
             # Obtener el modelo Whisper
             if not self.current_whisper_model:
                 self.current_whisper_model = self.model_loader.get_whisper_model("base")
 
             if not self.current_whisper_model:
-                print("ERROR: No se pudo cargar el modelo Whisper")
+                logger.error("No se pudo cargar el modelo Whisper")
                 return None, None
 
             # Transcribir con Whisper usando chunked processing
-            print("Iniciando transcripción con Whisper...")
-            print(f"Idioma seleccionado por usuario: {src_lang}")
-
-            result = transcribe_long_audio(
-                self.current_whisper_model,
-                temp_filename,
-                language=None if src_lang == "auto" else src_lang,
-                min_duration=0.5,
-                transcribe_options={
-                    "word_timestamps": True,
-                    "fp16": False,
-                    "temperature": 0.0,
-                    "condition_on_previous_text": True,
-                },
+            logger.debug(
+                "Iniciando transcripción con Whisper (idioma seleccionado: %s)",
+                src_lang,
             )
 
-            print("\nResultado completo de Whisper:")
-            print(f"- Texto: '{result['text']}'")
-            print(f"- Idioma detectado: {result['language']}")
-            print(f"- Longitud del texto: {len(result['text'])}")
-            print(f"- Texto después de strip: '{result['text'].strip()}'")
-            print(f"- Longitud después de strip: {len(result['text'].strip())}")
-
-            # Mostrar información adicional del resultado
-            if "segments" in result:
-                print(f"- Número de segmentos: {len(result['segments'])}")
-                for i, segment in enumerate(result["segments"]):
-                    print(
-                        f"  Segmento {i}: '{segment['text']}' (confianza: {segment.get('avg_logprob', 'N/A')})"
+            result = self._transcribe_full(pcm, src_lang)
+
+            # Only walk the segments when someone is actually listening.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Resultado de Whisper: texto=%r idioma=%s",
+                    result["text"],
+                    result["language"],
+                )
+                for i, segment in enumerate(result.get("segments", [])):
+                    logger.debug(
+                        "  Segmento %d: %r (confianza: %s)",
+                        i,
+                        segment["text"],
+                        segment.get("avg_logprob", "N/A"),
                     )
 
             texto_transcrito = result["text"].strip()
             idioma_detectado = result["language"]
 
-            # Limpiar archivo temporal
-            os.unlink(temp_filename)
-            print("Archivo temporal eliminado")
-
-            # Validar resultado
-            print("\nValidando texto...")
-            print(f"- Texto a validar: '{texto_transcrito}'")
-            print(f"- Idioma detectado: {idioma_detectado}")
-
             es_valido = self.controller.validate_text(
                 texto_transcrito, idioma_detectado
             )
-            print(f"- Resultado de validación: {es_valido}")
+            logger.debug(
+                "Validación de %r (%s): %s",
+                texto_transcrito,
+                idioma_detectado,
+                es_valido,
+            )
 
             if es_valido:
                 # El idioma detectado ya viene en formato ISO, no necesitamos mapear
-                idioma_final = idioma_detectado
-                print(f"- Idioma final: {idioma_final}")
-                print(f"- RETORNANDO: '{texto_transcrito}', '{idioma_final}'")
-                print("=== FIN DE PROCESO WHISPER (EXITOSO) ===\n")
-                return texto_transcrito, idioma_final
+                logger.debug("=== FIN DE PROCESO WHISPER (EXITOSO) ===")
+                return texto_transcrito, idioma_detectado
             else:
-                print("- TEXTO NO VÁLIDO - Retornando None")
-                print("=== FIN DE PROCESO WHISPER (FALLIDO) ===\n")
+                logger.debug("=== FIN DE PROCESO WHISPER (FALLIDO) ===")
                 return None, None
 
-        except Exception as e:
-            print(f"\nERROR EN WHISPER: {e}")
-            print(f"Tipo de error: {type(e)}")
-            import traceback
-
-            traceback.print_exc()
-            print("=== FIN DE PROCESO WHISPER (ERROR) ===\n")
+        except Exception:
+            logger.exception("Error en Whisper")
             return None, None
 
     def play_translation(self):
@@ -963,10 +935,7 @@ class FluentAIGUI:
             return
 
         self.update_status("🔊 Reproduciendo traducción...", "yellow")
-
-        thread = threading.Thread(target=self.play_audio)
-        thread.daemon = True
-        thread.start()
+        self._bg.submit(self.play_audio)
 
     def play_audio(self):
         """Reproduce el audio de la traducción."""
@@ -974,13 +943,20 @@ class FluentAIGUI:
             return
         try:
             lang = self.controller.detect_tts_language(self.current_translation)
-            samples = synthesize_to_numpy(
-                self.current_translation, lang, sample_rate=44100
-            )
+            # Stream straight to the output device when possible (no temp
+            # file render); otherwise synthesize to numpy and play it.
+            if speak_to_device(self.current_translation, lang, blocking=True):
+                self.message_queue.put(
+                    ("status", "✅ Reproducción completada", "lightgreen")
+                )
+                return
+            samples = _synthesize_cached(self.current_translation, lang)
             if samples.size == 0:
+                # Don't keep a failed synthesis around for the next replay.
+                _synthesize_cached.cache_clear()
                 self.message_queue.put(("status", "❌ TTS no generó audio", "red"))
                 return
-            sd.play(samples, samplerate=44100)
+            sd.play(samples, samplerate=TTS_SAMPLE_RATE)
             sd.wait()
             self.message_queue.put(
                 ("status", "✅ Reproducción completada", "lightgreen")
@@ -990,63 +966,79 @@ class FluentAIGUI:
 
     def check_message_queue(self):
         """Verifica la cola de mensajes y actualiza la UI"""
+        messages = []
         try:
             while True:
-                message_type, *args = self.message_queue.get_nowait()
-
-                if message_type == "status":
-                    self.update_status(args[0], args[1] if len(args) > 1 else "white")
-                elif message_type == "progress":
-                    self.show_progress(args[0])
-                elif message_type == "progress_value":
-                    self.progress_var.set(args[0])
-                elif message_type == "enable_record":
-                    self.record_btn.config(state=tk.NORMAL)
-                elif message_type == "enable_load_btn":
-                    self.load_models_btn.config(state=tk.NORMAL)
-                elif message_type == "enable_play":
-                    self.play_btn.config(state=tk.NORMAL)
-                elif message_type == "original_text":
-                    self.original_text.delete(1.0, tk.END)
-                    self.original_text.insert(tk.END, args[0])
-                elif message_type == "translated_text":
-                    self.translated_text.delete(1.0, tk.END)
-                    self.translated_text.insert(tk.END, args[0])
-                elif message_type == "meeting_caption":
-                    # Live streaming caption: committed text + greyed tentative.
-                    committed, tentative = args[0], args[1]
-                    self.original_text.delete(1.0, tk.END)
-                    self.original_text.insert(tk.END, committed)
-                    if tentative:
-                        self.original_text.insert(
-                            tk.END,
-                            (" " if committed else "") + tentative,
-                            "tentative",
-                        )
-                    self.original_text.tag_config("tentative", foreground="#999999")
-                    self.original_text.see(tk.END)
-                elif message_type == "meeting_translation_append":
-                    self.translated_text.insert(tk.END, args[0] + " ")
-                    self.translated_text.see(tk.END)
-                elif message_type == "reset_record_btn":
-                    self.record_btn.config(text="🎤 Hablar", bg="#2ecc71")
-                elif message_type == "spinner":
-                    if args[0] == "start":
-                        self.start_spinner()
-                    else:
-                        self.stop_spinner()
-                elif message_type == "listening_indicator":
-                    self.update_listening_indicator(args[0])
-                elif message_type == "model_status":
-                    self.update_model_status(
-                        args[0], args[1], args[2] if len(args) > 2 else None
-                    )
-
+                messages.append(self.message_queue.get_nowait())
         except queue.Empty:
             pass
 
-        # Programar la próxima verificación
-        self.root.after(100, self.check_message_queue)
+        # Overwrite-style updates only need their latest value applied; skip
+        # any that a later message of the same type would replace anyway.
+        last_index = {msg[0]: i for i, msg in enumerate(messages)}
+        for i, (message_type, *args) in enumerate(messages):
+            if message_type in _COALESCED_MESSAGES and last_index[message_type] != i:
+                continue
+            self._apply_message(message_type, args)
+
+        # Poll quickly while messages keep arriving, back off when idle.
+        self.root.after(
+            MESSAGE_POLL_BUSY_MS if messages else MESSAGE_POLL_IDLE_MS,
+            self.check_message_queue,
+        )
+
+    def _apply_message(self, message_type, args):
+        """Aplica un mensaje de la cola a los widgets."""
+        if message_type == "status":
+            self.update_status(args[0], args[1] if len(args) > 1 else "white")
+        elif message_type == "progress":
+            self.show_progress(args[0])
+        elif message_type == "progress_value":
+            self.progress_var.set(args[0])
+        elif message_type == "enable_record":
+            self.record_btn.config(state=tk.NORMAL)
+        elif message_type == "enable_load_btn":
+            self.load_models_btn.config(state=tk.NORMAL)
+        elif message_type == "enable_play":
+            self.play_btn.config(state=tk.NORMAL)
+        elif message_type == "original_text":
+            self.original_text.delete(1.0, tk.END)
+            self.original_text.insert(tk.END, args[0])
+        elif message_type == "translated_text":
+            self.translated_text.delete(1.0, tk.END)
+            self.translated_text.insert(tk.END, args[0])
+        elif message_type == "meeting_caption":
+            # Live streaming caption: committed text + greyed tentative.
+            committed, tentative = args[0], args[1]
+            self.original_text.delete(1.0, tk.END)
+            self.original_text.insert(tk.END, committed)
+            if tentative:
+                self.original_text.insert(
+                    tk.END,
+                    (" " if committed else "") + tentative,
+                    "tentative",
+                )
+            self.original_text.tag_config("tentative", foreground="#999999")
+            self.original_text.see(tk.END)
+        elif message_type == "meeting_translation_append":
+            self.translated_text.insert(tk.END, args[0] + " ")
+            self.translated_text.see(tk.END)
+        elif message_type == "reset_record_btn":
+            self.record_btn.config(text="🎤 Hablar", bg="#2ecc71")
+        elif message_type == "spinner":
+            if args[0] == "start":
+                self.start_spinner()
+            else:
+                self.stop_spinner()
+        elif message_type == "listening_indicator":
+            self.update_listening_indicator(args[0])
+        elif message_type == "model_status":
+            self.update_model_status(
+                args[0], args[1], args[2] if len(args) > 2 else None
+            )
+        elif message_type == "callback":
+            # Resultado de _run_in_background: on_done(resultado).
+            args[0](args[1])
 
     def _on_model_progress(self, message, progress):
         """Callback para reportar progreso de carga de modelos"""
@@ -1071,21 +1063,13 @@ class FluentAIGUI:
 
     def start_spinner(self):
         """Inicia el spinner de carga"""
-        self.spinner_active = True
-        self.spinner_label.pack(pady=2)
-        self.animate_spinner()
+        self.spinner_bar.pack(pady=2)
+        self.spinner_bar.start(120)
 
     def stop_spinner(self):
         """Detiene el spinner de carga"""
-        self.spinner_active = False
-        self.spinner_label.pack_forget()
-
-    def animate_spinner(self):
-        """Anima el spinner"""
-        if self.spinner_active:
-            self.spinner_label.config(text=self.spinner_chars[self.spinner_index])
-            self.spinner_index = (self.spinner_index + 1) % len(self.spinner_chars)
-            self.root.after(200, self.animate_spinner)
+        self.spinner_bar.stop()
+        self.spinner_bar.pack_forget()
 
     def preload_models_for_selection(self):
         """Precarga modelos basados en la dirección actual de traducción"""
@@ -1094,93 +1078,102 @@ class FluentAIGUI:
         # Precargar solo el modelo específico
         self.load_specific_model(src_lang, tgt_lang)
 
-    def load_models_for_languages(self, lang_list):
-        """Carga modelos para una lista de idiomas en un hilo separado"""
+    def _run_in_background(self, fn, on_done, *args):
+        """Ejecuta fn(*args) en el pool compartido; on_done(resultado) en el hilo Tk.
 
-        def load_in_thread():
-            self.message_queue.put(("spinner", "start"))
-            self.message_queue.put(
-                ("status", "🔄 Cargando modelos para auto-detección...", "orange")
-            )
+        Si fn lanza una excepción, on_done recibe None. El resultado vuelve por
+        message_queue, así que el hilo del pool nunca llama a Tk (que puede
+        estar ya destruido si la ventana se cerró durante la carga).
+        """
 
-            # Usar load_all_for_languages para cargar todos los modelos necesarios
-            results = self.model_loader.load_all_for_languages(lang_list)
+        def finish(future):
+            try:
+                result = future.result()
+            except Exception:
+                logger.exception("Background task %s failed", fn.__name__)
+                result = None
+            self.message_queue.put(("callback", on_done, result))
 
-            success_count = sum(1 for success in results.values() if success)
-            total_count = len(results)
+        self._bg.submit(fn, *args).add_done_callback(finish)
 
-            self.message_queue.put(("spinner", "stop"))
-            if success_count == total_count:
-                self.message_queue.put(
-                    (
-                        "status",
-                        f"✅ Todos los modelos cargados ({success_count}/{total_count})",
-                        "lightgreen",
-                    )
-                )
-            else:
-                self.message_queue.put(
-                    (
-                        "status",
-                        f"⚠️ Algunos modelos fallaron ({success_count}/{total_count})",
-                        "orange",
-                    )
-                )
-
-        thread = threading.Thread(target=load_in_thread, daemon=True)
-        thread.start()
+    def load_models_for_languages(self, lang_list):
+        """Carga modelos para una lista de idiomas en segundo plano"""
+        self.start_spinner()
+        self.update_status("🔄 Cargando modelos para auto-detección...", "orange")
+        self._run_in_background(
+            self.model_loader.load_all_for_languages,
+            self._on_language_models_loaded,
+            lang_list,
+        )
 
-    def load_specific_model(self, src_lang, tgt_lang):
-        """Carga un modelo específico en un hilo separado"""
+    def _on_language_models_loaded(self, results):
+        self.stop_spinner()
+        results = results or {}
+        success_count = sum(1 for success in results.values() if success)
+        total_count = len(results)
 
-        def load_in_thread():
-            self.message_queue.put(("spinner", "start"))
-            self.message_queue.put(
-                ("status", f"🔄 Cargando modelo {src_lang}→{tgt_lang}...", "orange")
+        if results and success_count == total_count:
+            self.update_status(
+                f"✅ Todos los modelos cargados ({success_count}/{total_count})",
+                "lightgreen",
+            )
+        else:
+            self.update_status(
+                f"⚠️ Algunos modelos fallaron ({success_count}/{total_count})",
+                "orange",
             )
 
-            model = self.model_loader.get_model(src_lang, tgt_lang)
-
-            self.message_queue.put(("spinner", "stop"))
-            if model:
-                self.message_queue.put(
-                    ("status", f"✅ Modelo {src_lang}→{tgt_lang} cargado", "lightgreen")
-                )
-            else:
-                self.message_queue.put(
-                    ("status", f"❌ Error cargando modelo {src_lang}→{tgt_lang}", "red")
-                )
+    def load_specific_model(self, src_lang, tgt_lang):
+        """Carga un modelo específico en segundo plano"""
+        self.start_spinner()
+        self.update_status(f"🔄 Cargando modelo {src_lang}→{tgt_lang}...", "orange")
+        self._run_in_background(
+            self.model_loader.get_model,
+            lambda model: self._on_specific_model_loaded(model, src_lang, tgt_lang),
+            src_lang,
+            tgt_lang,
+        )
 
-        thread = threading.Thread(target=load_in_thread, daemon=True)
-        thread.start()
+    def _on_specific_model_loaded(self, model, src_lang, tgt_lang):
+        self.stop_spinner()
+        if model:
+            self.update_status(f"✅ Modelo {src_lang}→{tgt_lang} cargado", "lightgreen")
+        else:
+            self.update_status(f"❌ Error cargando modelo {src_lang}→{tgt_lang}", "red")
 
     def load_whisper_model(self):
         """Carga el modelo Whisper"""
+        self.start_spinner()
+        self.update_status("🔄 Cargando modelo Whisper...", "orange")
+        self.update_model_status("whisper", "loading")
+        self._run_in_background(
+            self._load_whisper_and_warm_up,
+            self._on_whisper_model_loaded,
+            "base",
+        )
 
-        def load_in_thread():
-            self.message_queue.put(("spinner", "start"))
-            self.message_queue.put(
-                ("status", "🔄 Cargando modelo Whisper...", "orange")
-            )
-            self.message_queue.put(("model_status", "whisper", "loading"))
-
-            model = self.model_loader.get_whisper_model("base")
+    def _load_whisper_and_warm_up(self, model_size):
+        """Load Whisper and compile the audio preprocessing (pool thread).
 
-            self.message_queue.put(("spinner", "stop"))
-            if model:
-                self.current_whisper_model = model
-                self.message_queue.put(
-                    ("status", "✅ Modelo Whisper cargado", "lightgreen")
-                )
-                self.message_queue.put(("model_status", "whisper", "loaded"))
-            else:
-                self.message_queue.put(
-                    ("status", "❌ Error cargando modelo Whisper", "red")
-                )
-                self.message_queue.put(("model_status", "whisper", "error"))
-
-        thread = threading.Thread(target=load_in_thread, daemon=True)
-        thread.start()
+        With numba installed prepare_for_whisper is compiled on first use;
+        running it once here keeps that cost off the first recording.
+        """
+        model = self.model_loader.get_whisper_model(model_size)
+        try:
+            prepare_for_whisper(b"\0\0" * 160)
+        except Exception:
+            logger.exception("Audio preprocessing warm-up failed")
+        return model
+
+    def _on_whisper_model_loaded(self, model):
+        self.stop_spinner()
+        if model:
+            self.current_whisper_model = model
+            self.update_status("✅ Modelo Whisper cargado", "lightgreen")
+            self.update_model_status("whisper", "loaded")
+        else:
+            self.update_status("❌ Error cargando modelo Whisper", "red")
+            self.update_model_status("whisper", "error")
 
     def toggle_silence_detection(self):
         """Activa/desactiva la detección de silencio"""
@@ -1261,39 +1254,73 @@ class FluentAIGUI:
                 silence_thresh=self.silence_thresh.get(),
             )
 
+    def _start_mic_display(self):
+        """Arm the mic meter refresh loop if it isn't already running."""
+        if not self._mic_display_active:
+            self._mic_display_active = True
+            self.update_mic_level_display()
+
     def update_mic_level_display(self):
-        """Update the microphone level meter display"""
+        """Update the microphone level meter display.
+
+        Refreshes every 100 ms while recording, processing, the simulated
+        level is decaying or Meeting Mode is on; once all are off it draws
+        the final level and stops, so an idle window schedules nothing.
+        """
         if not hasattr(self, "mic_level_canvas"):
+            self._mic_display_active = False
             return
 
-        # Clear the canvas
-        self.mic_level_canvas.delete("all")
+        active = (
+            self.is_listening
+            or self.is_processing
+            or self._mic_simulation_active
+            or self.meeting_mode_active
+        )
+        level = self.microphone_level
+        # Nothing visible changed (the common case while the mic is quiet).
+        if active and abs(level - self._last_mic_level) < MIC_LEVEL_EPSILON:
+            self.root.after(100, self.update_mic_level_display)
+            return
+        self._last_mic_level = level
 
         # Calculate level bar width based on microphone level (0.0 to 1.0)
         canvas_width = 100
         canvas_height = 8
-        level_width = int(canvas_width * self.microphone_level)
+        level_width = int(canvas_width * level)
 
-        # Draw background
-        self.mic_level_canvas.create_rectangle(
-            0, 0, canvas_width, canvas_height, fill="#2c3e50", outline="#2c3e50"
-        )
+        if self._mic_level_bar is None:
+            # Draw background and level bar once; later updates move them.
+            self.mic_level_canvas.create_rectangle(
+                0, 0, canvas_width, canvas_height, fill="#2c3e50", outline="#2c3e50"
+            )
+            self._mic_level_bar = self.mic_level_canvas.create_rectangle(
+                0, 0, 0, canvas_height, state=tk.HIDDEN
+            )
 
         # Draw level bar with color based on level
         if level_width > 0:
-            if self.microphone_level < 0.3:
+            if level < 0.3:
                 color = "#27ae60"  # Green for low levels
-            elif self.microphone_level < 0.7:
+            elif level < 0.7:
                 color = "#f39c12"  # Orange for medium levels
             else:
                 color = "#e74c3c"  # Red for high levels
 
-            self.mic_level_canvas.create_rectangle(
-                0, 0, level_width, canvas_height, fill=color, outline=color
+            self.mic_level_canvas.coords(
+                self._mic_level_bar, 0, 0, level_width, canvas_height
             )
+            self.mic_level_canvas.itemconfig(
+                self._mic_level_bar, fill=color, outline=color, state=tk.NORMAL
+            )
+        else:
+            self.mic_level_canvas.itemconfig(self._mic_level_bar, state=tk.HIDDEN)
 
         # Schedule next update
-        self.root.after(100, self.update_mic_level_display)
+        if active:
+            self.root.after(100, self.update_mic_level_display)
+        else:
+            self._mic_display_active = False
 
     def update_listening_indicator(self, state):
         """Update the listening/processing indicator"""
@@ -1301,10 +1328,12 @@ class FluentAIGUI:
             self.listening_indicator.config(text="🎤 Listening...", fg="#27ae60")
             self.is_listening = True
             self.is_processing = False
+            self._start_mic_simulation()
         elif state == "processing":
             self.listening_indicator.config(text="⚙️ Processing...", fg="#f39c12")
             self.is_listening = False
             self.is_processing = True
+            self._start_mic_simulation()
         elif state == "silence_detected":
             self.listening_indicator.config(text="🔇 Silence detected", fg="#e74c3c")
         else:
@@ -1342,13 +1371,33 @@ class FluentAIGUI:
         elif model_type == "none":
             self.model_status_label.config(text="📋 No model loaded", fg="#95a5a6")
 
+    def _start_mic_simulation(self):
+        """Arm the simulated mic level loop if it isn't already running."""
+        if not self._mic_simulation_active:
+            self._mic_simulation_active = True
+            self.simulate_microphone_level()
+            self._start_mic_display()
+
+    def _on_capture_level(self, rms):
+        """Level callback from AudioCaptureThread (runs on the audio thread).
+
+        Only stores the level; update_mic_level_display polls it on the Tk
+        thread, so the audio callback never waits on the GUI.
+        """
+        self.microphone_level = min(1.0, rms * MIC_LEVEL_GAIN)
+
     def simulate_microphone_level(self):
-        """Simulate microphone level changes during recording"""
+        """Simulate microphone level changes during recording.
+
+        Only runs while recording/processing (and while the meter decays back
+        to zero); idle, nothing is scheduled.
+        """
         if self.is_listening:
             # Simulate varying microphone levels during listening
-            import random
-
-            self.microphone_level = random.uniform(0.1, 0.8)
+            self.microphone_level = float(
+                self._mic_noise[self._mic_noise_index % MIC_NOISE_SIZE]
+            )
+            self._mic_noise_index += 1
         elif self.is_processing:
             # Show steady low level during processing
             self.microphone_level = 0.2
@@ -1356,8 +1405,11 @@ class FluentAIGUI:
             # Gradually decrease to zero when not recording
             self.microphone_level = max(0.0, self.microphone_level - 0.05)
 
-        # Schedule next update
-        self.root.after(50, self.simulate_microphone_level)
+        # Schedule next update, or stop once the meter has settled at zero
+        if self.is_listening or self.is_processing or self.microphone_level > 0:
+            self.root.after(50, self.simulate_microphone_level)
+        else:
+            self._mic_simulation_active = False
 
     # ── Meeting Mode ─────────────────────────────────────────────────────────
 
@@ -1455,6 +1507,8 @@ class FluentAIGUI:
             mute_event=mute_event,
             # Emit growing snapshots so captions stream as you speak.
             partial_interval_ms=700,
+            # Drive the mic meter from the real input level.
+            level_callback=self._on_capture_level,
         )
         self.meeting_asr_thread = StreamingTranscriber(
             asr_queue=self.meeting_asr_queue,
@@ -1485,6 +1539,7 @@ class FluentAIGUI:
         self.meeting_speak_thread.start()
 
         self.meeting_mode_active = True
+        self._start_mic_display()
         self._meeting_direction_label = f"{src_lang.upper()}→{dst_lang.upper()}"
 
         # Fresh transcript: live caption (original) + accumulating translation.
@@ -1525,6 +1580,7 @@ class FluentAIGUI:
         self.meeting_asr_queue = None
         self.meeting_speak_queue = None
         self.meeting_mode_active = False
+        self.microphone_level = 0.0
 
         # Restore the system default input device we switched to BlackHole.
         audio_setup.exit_meeting_routing(self.meeting_routing_state)
@@ -1772,6 +1828,7 @@ class FluentAIGUI:
         # Safety net: never leave the user's default mic switched to BlackHole.
         audio_setup.exit_meeting_routing(self.meeting_routing_state)
         self.meeting_routing_state = None
+        self._bg.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
 
 
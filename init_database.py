@@ -4,7 +4,7 @@ Initialize DuckDB database for FluentAI translation logging
 This script creates the database, tables, and tests the logging functionality
 """
 
-from datetime import datetime
+import time
 
 from fluentai.database_logger import db_logger, generate_session_id
 
@@ -18,86 +18,92 @@ def test_database_functionality():
     session_id = generate_session_id()
     print(f"📝 Generated test session ID: {session_id}")
 
-    # Test 1: Audio capture logging
-    print("\n1️⃣ Testing audio capture logging...")
-    db_logger.log_audio_capture(
-        session_id=session_id,
-        channel="MacBook Pro Microphone",
-        message="Test audio capture: 2.5s audio (40,000 samples)",
-        latency_ms=150.5,
-        language="es",
-        metadata={
-            "duration": 2.5,
-            "samples": 40000,
-            "sample_rate": 16000,
-            "wav_size": 80000,
-        },
-    )
-    print("✅ Audio capture log created")
-
-    # Test 2: ASR translation logging
-    print("\n2️⃣ Testing ASR translation logging...")
-    db_logger.log_asr_translation(
-        session_id=session_id,
-        input_lang="es",
-        output_lang="en",
-        original_text="Hola, ¿cómo estás?",
-        translated_text="Hello, how are you?",
-        model_used="whisper-base",
-        latency_ms=850.2,
-        metadata={
-            "audio_duration": 2.5,
-            "audio_samples": 40000,
-            "output_samples": 132300,
-        },
-    )
-    print("✅ ASR translation log created")
-
-    # Test 3: Audio playback logging
-    print("\n3️⃣ Testing audio playback logging...")
-    db_logger.log_audio_playback(
-        session_id=session_id,
-        output_channel="BlackHole 2ch",
-        message="Played 132,300 samples",
-        latency_ms=45.8,
-        language="en",
-        metadata={"sample_rate": 44100, "audio_samples": 132300, "chunk_size": 1024},
-    )
-    print("✅ Audio playback log created")
-
-    # Test 4: Complete translation logging
-    print("\n4️⃣ Testing complete translation logging...")
-    db_logger.log_complete_translation(
-        session_id=session_id,
-        input_language="es",
-        output_language="en",
-        input_channel="MacBook Pro Microphone",
-        output_channel="BlackHole 2ch",
-        full_message_input="Hola, ¿cómo estás?",
-        full_message_translated="Hello, how are you?",
-        total_segments_audio=1,
-        total_segments_asr=1,
-        total_segments_output=1,
-        model_used="whisper-base",
-        total_latency_ms=1046.5,
-        metadata={
-            "source_language": "es",
-            "target_language": "en",
-            "session_start": datetime.now().isoformat(),
-        },
-    )
-    print("✅ Complete translation log created")
-
-    # Test 5: Error logging
-    print("\n5️⃣ Testing error logging...")
-    db_logger.log_audio_capture(
-        session_id=session_id,
-        channel="MacBook Pro Microphone",
-        message="Queue full, dropped recording",
-        latency_ms=0,
-        errors=["Queue full - recording dropped", "Timeout after 50ms"],
-    )
-    print("✅ Error log created")
+    # Tests 1-5 write in one transaction (a single commit instead of five).
+    with db_logger.bulk():
+        # Test 1: Audio capture logging
+        print("\n1️⃣ Testing audio capture logging...")
+        db_logger.log_audio_capture(
+            session_id=session_id,
+            channel="MacBook Pro Microphone",
+            message="Test audio capture: 2.5s audio (40,000 samples)",
+            latency_ms=150.5,
+            language="es",
+            metadata={
+                "duration": 2.5,
+                "samples": 40000,
+                "sample_rate": 16000,
+                "wav_size": 80000,
+            },
+        )
+        print("✅ Audio capture log created")
+
+        # Test 2: ASR translation logging
+        print("\n2️⃣ Testing ASR translation logging...")
+        db_logger.log_asr_translation(
+            session_id=session_id,
+            input_lang="es",
+            output_lang="en",
+            original_text="Hola, ¿cómo estás?",
+            translated_text="Hello, how are you?",
+            model_used="whisper-base",
+            latency_ms=850.2,
+            metadata={
+                "audio_duration": 2.5,
+                "audio_samples": 40000,
+                "output_samples": 132300,
+            },
+        )
+        print("✅ ASR translation log created")
+
+        # Test 3: Audio playback logging
+        print("\n3️⃣ Testing audio playback logging...")
+        db_logger.log_audio_playback(
+            session_id=session_id,
+            output_channel="BlackHole 2ch",
+            message="Played 132,300 samples",
+            latency_ms=45.8,
+            language="en",
+            metadata={
+                "sample_rate": 44100,
+                "audio_samples": 132300,
+                "chunk_size": 1024,
+            },
+        )
+        print("✅ Audio playback log created")
+
+        # Test 4: Complete translation logging
+        print("\n4️⃣ Testing complete translation logging...")
+        db_logger.log_complete_translation(
+            session_id=session_id,
+            input_language="es",
+            output_language="en",
+            input_channel="MacBook Pro Microphone",
+            output_channel="BlackHole 2ch",
+            full_message_input="Hola, ¿cómo estás?",
+            full_message_translated="Hello, how are you?",
+            total_segments_audio=1,
+            total_segments_asr=1,
+            total_segments_output=1,
+            model_used="whisper-base",
+            total_latency_ms=1046.5,
+            metadata={
+                "source_language": "es",
+                "target_language": "en",
+                "session_start_ns": time.time_ns(),
+            },
+        )
+        print("✅ Complete translation log created")
+
+        # Test 5: Error logging
+        print("\n5️⃣ Testing error logging...")
+        db_logger.log_audio_capture(
+            session_id=session_id,
+            channel="MacBook Pro Microphone",
+            message="Queue full, dropped recording",
+            latency_ms=0,
+            errors=["Queue full - recording dropped", "Timeout after 50ms"],
+        )
+        print("✅ Error log created")
 
     # Test 6: Retrieve session logs
     print("\n6️⃣ Testing log retrieval...")
@@ -151,30 +157,34 @@ def show_database_info():
 
         conn = duckdb.connect("translation_logs.duckdb")
 
-        # Show tables
-        tables = conn.execute("SHOW TABLES").fetchall()
-        print(f"📊 Tables: {[table[0] for table in tables]}")
-
-        # Show translation_logs schema
-        print("\n🗂️  translation_logs table schema:")
-        schema = conn.execute("DESCRIBE translation_logs").fetchall()
-        for column in schema:
-            print(f"   {column[0]}: {column[1]}")
-
-        print("\n🗂️  translations table schema:")
-        schema = conn.execute("DESCRIBE translations").fetchall()
-        for column in schema:
-            print(f"   {column[0]}: {column[1]}")
-
-        # Show row counts
-        log_count = conn.execute("SELECT COUNT(*) FROM translation_logs").fetchone()[0]
-        translation_count = conn.execute(
-            "SELECT COUNT(*) FROM translations"
-        ).fetchone()[0]
+        # Every table's columns in one catalog query instead of SHOW TABLES
+        # plus a DESCRIBE per table.
+        columns = conn.execute(
+            "SELECT table_name, column_name, data_type FROM duckdb_columns() "
+            "WHERE schema_name = 'main' AND NOT internal "
+            "ORDER BY table_name, column_index"
+        ).fetchall()
+        schemas = {}
+        for table, column, data_type in columns:
+            schemas.setdefault(table, []).append((column, data_type))
+        print(f"📊 Tables: {list(schemas)}")
+
+        for table in ("translation_logs", "translations"):
+            print(f"\n🗂️  {table} table schema:")
+            for column, data_type in schemas.get(table, []):
+                print(f"   {column}: {data_type}")
+
+        # Both row counts in a single query
+        counts = dict(
+            conn.execute(
+                "SELECT 'translation_logs', COUNT(*) FROM translation_logs "
+                "UNION ALL SELECT 'translations', COUNT(*) FROM translations"
+            ).fetchall()
+        )
 
         print("\n📈 Current data:")
-        print(f"   translation_logs: {log_count} rows")
-        print(f"   translations: {translation_count} rows")
+        print(f"   translation_logs: {counts['translation_logs']} rows")
+        print(f"   translations: {counts['translations']} rows")
 
         conn.close()
 
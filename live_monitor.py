@@ -8,15 +8,47 @@ database for later analysis.
 """
 
 import argparse
-import os
-import queue
+import signal
+import sys
 import threading
 import time
-from datetime import datetime
 
 from audio_capture_thread import AudioCaptureThread
 from fluentai.asr_translation_synthesis_thread import ASRTranslationSynthesisThread
 from fluentai.blackhole_reproduction_thread import BlackHoleReproductionThread
+from fluentai.ring_queue import RingQueue
+
+# ANSI: cursor home + erase display (no need to spawn `clear`).
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+# ANSI: move to 1-based row, column 1 / erase to end of line / of display.
+MOVE_TO_ROW = "\x1b[{};1H"
+CLEAR_EOL = "\x1b[K"
+CLEAR_EOS = "\x1b[J"
+# ANSI: hide the cursor while the dashboard is live / show it again.
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+# Synchronized output (mode 2026): the terminal applies everything between
+# these at once, so a frame is never shown half-updated. Terminals without
+# support ignore them.
+SYNC_BEGIN = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+
+# Capacity of both pipeline queues shown on the dashboard.
+QUEUE_MAXSIZE = 10
+
+# Dashboard strings looked up by state instead of chosen with branches.
+_STATUS = ("🔴 WAITING", "🟢 ACTIVE")  # indexed by "has handled a segment"
+_PULSE = ("⚪",) + ("🟡",) * QUEUE_MAXSIZE  # indexed by queue size
+_LIVE_ACTIVITY = (  # indexed by 2 * (asr queue busy) + (output queue busy)
+    "⚡ LIVE ACTIVITY: Waiting for speech...",
+    "⚡ LIVE ACTIVITY: Playing translated audio...",
+    "⚡ LIVE ACTIVITY: Audio being processed...",
+    "⚡ LIVE ACTIVITY: Audio being processed...",
+)
+_FLOW_CHARS = ("▶", "▶▶", "▶▶▶", "▶▶▶▶")
+
+# Longest time the dashboard goes without a redraw when nothing changes.
+DASHBOARD_KEEPALIVE_S = 2.0
 
 
 class LiveMonitor:
@@ -33,9 +65,19 @@ class LiveMonitor:
 
             self.db_logger = db_logger
             self.session_id = generate_session_id()
-
-        self.asr_queue = queue.Queue(maxsize=10)
-        self.output_queue = queue.Queue(maxsize=10)
+        # Wall-clock start as epoch nanoseconds; formatted only when read
+        # (e.g. to_timestamp(session_start_ns / 1e9) in SQL).
+        self.session_start_ns = time.time_ns()
+
+        # Counters are bumped from the queues themselves as segments flow.
+        self.asr_queue = RingQueue(
+            maxsize=QUEUE_MAXSIZE, on_put=self._on_segment_captured
+        )
+        self.output_queue = RingQueue(
+            maxsize=QUEUE_MAXSIZE,
+            on_put=self._on_segment_processed,
+            on_get=self._on_segment_played,
+        )
 
         # Performance counters
         self.audio_segments_captured = 0
@@ -47,17 +89,63 @@ class LiveMonitor:
         self.current_audio_length = 0
         self.is_recording = False
 
+        # Set whenever something on the dashboard changed; run() redraws on it.
+        self.dirty = threading.Event()
+
+        # Static dashboard header, formatted once.
+        title = "🎙️  FluentAI Real-time Translation - Live Monitor"
+        if self.use_db:
+            title += " with Database"
+        self._header = ("=" * 80, title, "=" * 80)
+        # Static instructions block, likewise built once.
+        instructions = [
+            "💡 INSTRUCTIONS:",
+            "-" * 40,
+            "• Speak in Spanish to see real-time translation",
+            "• Watch the queue bars fill up as audio is processed",
+            "• Audio will play through BlackHole device",
+            "• Press Ctrl+C to stop",
+        ]
+        if self.use_db:
+            instructions.append("• All operations are logged to DuckDB database")
+        instructions.append("")
+        self._instructions = tuple(instructions)
+        # Lines currently on the terminal; render_dashboard only rewrites the
+        # rows that differ from it.
+        self._screen: list[str] = []
+        # Set when the terminal is resized; the next frame is drawn in full.
+        self._repaint = False
+        # Every possible queue bar, indexed by queue size.
+        self._queue_bars = tuple(
+            self.create_progress_bar(size, QUEUE_MAXSIZE, width=15)
+            for size in range(QUEUE_MAXSIZE + 1)
+        )
+
         # Thread references
         self.capture_thread = None
         self.asr_thread = None
         self.blackhole_thread = None
 
-        # Lock for thread-safe updates
-        self.stats_lock = threading.Lock()
+    def _on_segment_captured(self, queue_size):
+        self.audio_segments_captured += 1
+        self.last_activity = f"Audio segment captured! Queue size: {queue_size}"
+        self.dirty.set()
+
+    def _on_segment_processed(self, queue_size):
+        self.audio_segments_processed += 1
+        self.last_activity = f"Audio processed! Output queue size: {queue_size}"
+        self.dirty.set()
+
+    def _on_segment_played(self, queue_size):
+        self.audio_segments_played += 1
+        self.last_activity = f"Audio played! Queue size: {queue_size}"
+        self.dirty.set()
 
     def clear_screen(self):
         """Clear terminal screen"""
-        os.system("clear" if os.name == "posix" else "cls")
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
+        self._screen = []
 
     def create_progress_bar(self, current, max_val, width=20):
         """Create a simple progress bar"""
@@ -68,9 +156,11 @@ class LiveMonitor:
         bar = "█" * filled + "░" * (width - filled)
         return f"[{bar}] {current}/{max_val}"
 
-    def get_queue_visual(self, queue_obj, max_size=10):
+    def get_queue_visual(self, queue_obj, max_size=QUEUE_MAXSIZE):
         """Create a visual representation of queue state"""
         current_size = queue_obj.qsize()
+        if max_size == QUEUE_MAXSIZE:
+            return self._queue_bars[min(current_size, QUEUE_MAXSIZE)]
         return self.create_progress_bar(current_size, max_size, width=15)
 
     def start_threads(self):
@@ -128,169 +218,126 @@ class LiveMonitor:
 
     def update_stats(self):
         """Update performance statistics"""
-        # These would be updated by thread callbacks in a real implementation
-        # For now, we'll estimate based on queue changes
+        # Counters are updated by the RingQueue callbacks as items flow.
         pass
 
     def render_dashboard(self):
-        """Render the live dashboard"""
-        self.clear_screen()
+        """Render the live dashboard.
 
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        The frame is assembled in memory and compared with the previous one;
+        only the rows that changed are rewritten (usually just the clock and
+        the queue lines), in a single write.
+        """
+        lines = list(self._header)
+        out = lines.append
 
-        print("=" * 80)
-        title = "🎙️  FluentAI Real-time Translation - Live Monitor"
-        if self.use_db:
-            title += " with Database"
-        print(title)
-        print("=" * 80)
-        print(f"⏰ Time: {now}")
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+
+        out(f"⏰ Time: {now}")
         if self.use_db:
-            print(f"🗄️  Session ID: {self.session_id}")
-        print(f"📊 Status: {self.last_activity}")
-        print()
+            out(f"🗄️  Session ID: {self.session_id}")
+        out(f"📊 Status: {self.last_activity}")
+        out("")
 
         # Queue visualization
-        print("📋 QUEUE STATES:")
-        print("-" * 40)
+        out("📋 QUEUE STATES:")
+        out("-" * 40)
         asr_size = self.asr_queue.qsize()
         output_size = self.output_queue.qsize()
 
-        print("🎤 Audio Capture → ASR Queue:")
-        print(f"   Size: {asr_size}/10  {self.get_queue_visual(self.asr_queue)}")
-        print(f"   📈 Segments captured: {self.audio_segments_captured}")
-        print()
+        out("🎤 Audio Capture → ASR Queue:")
+        out(f"   Size: {asr_size}/10  {self._queue_bars[asr_size]}")
+        out(f"   📈 Segments captured: {self.audio_segments_captured}")
+        out("")
 
-        print("🧠 ASR → Audio Output Queue:")
-        print(f"   Size: {output_size}/10  {self.get_queue_visual(self.output_queue)}")
-        print(f"   📈 Segments processed: {self.audio_segments_processed}")
-        print()
+        out("🧠 ASR → Audio Output Queue:")
+        out(f"   Size: {output_size}/10  {self._queue_bars[output_size]}")
+        out(f"   📈 Segments processed: {self.audio_segments_processed}")
+        out("")
 
-        print("🔊 BlackHole Audio Output:")
-        print(f"   📈 Segments played: {self.audio_segments_played}")
-        print()
+        out("🔊 BlackHole Audio Output:")
+        out(f"   📈 Segments played: {self.audio_segments_played}")
+        out("")
 
         # Processing activity
-        print("🔄 PROCESSING ACTIVITY:")
-        print("-" * 40)
+        out("🔄 PROCESSING ACTIVITY:")
+        out("-" * 40)
 
-        # Show queue activity indicators
-        activity_indicators = {
-            "🎤 Audio Capture": "🟢 ACTIVE"
-            if asr_size > 0 or self.audio_segments_captured > 0
-            else "🔴 WAITING",
-            "🧠 ASR Processing": "🟢 ACTIVE"
-            if output_size > 0 or self.audio_segments_processed > 0
-            else "🔴 WAITING",
-            "🔊 Audio Output": "🟢 ACTIVE"
-            if self.audio_segments_played > 0
-            else "🔴 WAITING",
-        }
-
-        for process, status in activity_indicators.items():
-            print(f"{process}: {status}")
-        print()
+        # Show queue activity indicators (a non-empty queue implies its
+        # counter is already > 0).
+        out(f"🎤 Audio Capture: {_STATUS[self.audio_segments_captured > 0]}")
+        out(f"🧠 ASR Processing: {_STATUS[self.audio_segments_processed > 0]}")
+        out(f"🔊 Audio Output: {_STATUS[self.audio_segments_played > 0]}")
+        out("")
 
         # Latest transcription/translation
-        print("📝 LATEST RESULTS:")
-        print("-" * 40)
-        print(f"🗣️  Transcription: {self.last_transcription or 'Waiting for speech...'}")
-        print(f"🌍 Translation: {self.last_translation or 'Waiting for speech...'}")
-        print()
+        out("📝 LATEST RESULTS:")
+        out("-" * 40)
+        out(f"🗣️  Transcription: {self.last_transcription or 'Waiting for speech...'}")
+        out(f"🌍 Translation: {self.last_translation or 'Waiting for speech...'}")
+        out("")
 
         # Database information
         if self.use_db:
-            print("🗄️  DATABASE LOGGING:")
-            print("-" * 40)
-            recent_logs = self.db_logger.get_session_logs(self.session_id)
-            if recent_logs:
-                print(f"📈 Total logs this session: {len(recent_logs)}")
-                for log in recent_logs[-3:]:
+            out("🗄️  DATABASE LOGGING:")
+            out("-" * 40)
+            total_logs, recent_logs = self.db_logger.get_session_activity(
+                self.session_id
+            )
+            if total_logs:
+                out(f"📈 Total logs this session: {total_logs}")
+                for log in recent_logs:
                     timestamp = log["timestamp"]
                     thread_name = {1: "Audio", 2: "ASR", 3: "Output"}[log["thread_id"]]
-                    print(f"   {timestamp}: {thread_name} - {log['message'][:50]}...")
+                    out(f"   {timestamp}: {thread_name} - {log['message'][:50]}...")
             else:
-                print("📈 No logs recorded yet")
-            print()
+                out("📈 No logs recorded yet")
+            out("")
 
         # Instructions
-        print("💡 INSTRUCTIONS:")
-        print("-" * 40)
-        print("• Speak in Spanish to see real-time translation")
-        print("• Watch the queue bars fill up as audio is processed")
-        print("• Audio will play through BlackHole device")
-        print("• Press Ctrl+C to stop")
-        if self.use_db:
-            print("• All operations are logged to DuckDB database")
-        print()
-
-        # Real-time queue flow animation
-        flow_chars = ["▶", "▶▶", "▶▶▶", "▶▶▶▶"]
-        flow_idx = int(time.time() * 3) % len(flow_chars)
+        lines.extend(self._instructions)
 
-        # Add pulsing effect for active queues
-        asr_pulse = "🟡" if asr_size > 0 else "⚪"
-        output_pulse = "🟡" if output_size > 0 else "⚪"
+        # Real-time queue flow animation, with a pulse on active queues
+        flow = _FLOW_CHARS[int(time.time() * 3) % len(_FLOW_CHARS)]
+        asr_pulse = _PULSE[asr_size]
+        output_pulse = _PULSE[output_size]
 
-        print("🔄 REAL-TIME FLOW:")
-        print("-" * 40)
-        flow_visual = f"🎤 Audio {flow_chars[flow_idx]} {asr_pulse} ASR {flow_chars[flow_idx]} {output_pulse} Output"
-        print(flow_visual)
-        print()
+        out("🔄 REAL-TIME FLOW:")
+        out("-" * 40)
+        out(f"🎤 Audio {flow} {asr_pulse} ASR {flow} {output_pulse} Output")
+        out("")
 
         # Add instant queue change indicator
-        if asr_size > 0:
-            print("⚡ LIVE ACTIVITY: Audio being processed...")
-        elif output_size > 0:
-            print("⚡ LIVE ACTIVITY: Playing translated audio...")
+        out(_LIVE_ACTIVITY[2 * (asr_size > 0) + (output_size > 0)])
+        out("")
+
+        out("=" * 80)
+
+        self._draw(lines)
+
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler: rows may have reflowed, so repaint everything."""
+        self._repaint = True
+        self.dirty.set()
+
+    def _draw(self, lines):
+        """Rewrite only the terminal rows whose text differs from ``lines``."""
+        previous = self._screen
+        if self._repaint or not previous:
+            self._repaint = False
+            parts = [CLEAR_SCREEN, "\n".join(lines), "\n"]
         else:
-            print("⚡ LIVE ACTIVITY: Waiting for speech...")
-        print()
-
-        print("=" * 80)
-
-    def count_segments(self):
-        """Background thread to count processed segments"""
-        last_asr_size = 0
-        last_output_size = 0
-
-        while self.running:
-            try:
-                current_asr = self.asr_queue.qsize()
-                current_output = self.output_queue.qsize()
-
-                # Count segments based on queue changes
-                with self.stats_lock:
-                    # Audio segments captured (when ASR queue increases)
-                    if current_asr > last_asr_size:
-                        self.audio_segments_captured += current_asr - last_asr_size
-                        self.last_activity = (
-                            f"Audio segment captured! Queue size: {current_asr}"
-                        )
-
-                    # Audio segments processed (when output queue increases)
-                    if current_output > last_output_size:
-                        self.audio_segments_processed += (
-                            current_output - last_output_size
-                        )
-                        self.last_activity = (
-                            f"Audio processed! Output queue size: {current_output}"
-                        )
-
-                    # Audio segments played (when output queue decreases)
-                    if current_output < last_output_size:
-                        self.audio_segments_played += last_output_size - current_output
-                        self.last_activity = (
-                            f"Audio played! Queue size: {current_output}"
-                        )
-
-                last_asr_size = current_asr
-                last_output_size = current_output
-
-                time.sleep(0.1)
-
-            except Exception:
-                break
+            parts = [
+                MOVE_TO_ROW.format(row) + line + CLEAR_EOL
+                for row, line in enumerate(lines, 1)
+                if row > len(previous) or previous[row - 1] != line
+            ]
+            if len(lines) < len(previous):
+                parts.append(MOVE_TO_ROW.format(len(lines) + 1) + CLEAR_EOS)
+            parts.append(MOVE_TO_ROW.format(len(lines) + 1))
+        self._screen = lines
+        sys.stdout.write(SYNC_BEGIN + "".join(parts) + SYNC_END)
+        sys.stdout.flush()
 
     def run(self):
         """Run the live monitor"""
@@ -304,14 +351,18 @@ class LiveMonitor:
             print("❌ Failed to start threads")
             return
 
-        # Start background counter thread
-        counter_thread = threading.Thread(target=self.count_segments, daemon=True)
-        counter_thread.start()
-
+        # A blinking cursor jumping between updated rows is the main source
+        # of visible flicker, so hide it while the dashboard runs.
+        sys.stdout.write(HIDE_CURSOR)
+        if hasattr(signal, "SIGWINCH"):  # Not available on Windows
+            signal.signal(signal.SIGWINCH, self._on_resize)
         try:
             while self.running:
                 self.render_dashboard()
-                time.sleep(0.5)  # Update every 0.5 seconds for more responsiveness
+                # Redraw as soon as something changes; otherwise only refresh
+                # the clock every DASHBOARD_KEEPALIVE_S.
+                self.dirty.wait(timeout=DASHBOARD_KEEPALIVE_S)
+                self.dirty.clear()
 
         except KeyboardInterrupt:
             print("\n🛑 Stopping live monitor...")
@@ -323,6 +374,10 @@ class LiveMonitor:
             if self.use_db:
                 self._print_database_summary()
 
+        finally:
+            sys.stdout.write(SHOW_CURSOR)
+            sys.stdout.flush()
+
     def log_complete_translation(self, input_text, translated_text):
         """Log a complete translation to the database (no-op without --db)."""
         if not self.use_db:
@@ -344,7 +399,7 @@ class LiveMonitor:
                 metadata={
                     "source_language": "es",
                     "target_language": "en",
-                    "session_start": datetime.now().isoformat(),
+                    "session_start_ns": self.session_start_ns,
                 },
             )
         except Exception as e:
@@ -354,21 +409,17 @@ class LiveMonitor:
         """Print a summary of what was logged to the database this session."""
         print("\n📊 Final Database Summary:")
         print("-" * 40)
-        session_logs = self.db_logger.get_session_logs(self.session_id)
-        if session_logs:
-            print(f"Total logs recorded: {len(session_logs)}")
-            audio_logs = [log for log in session_logs if log["thread_id"] == 1]
-            asr_logs = [log for log in session_logs if log["thread_id"] == 2]
-            output_logs = [log for log in session_logs if log["thread_id"] == 3]
-
-            print(f"Audio capture logs: {len(audio_logs)}")
-            print(f"ASR/Translation logs: {len(asr_logs)}")
-            print(f"Audio output logs: {len(output_logs)}")
-
-            error_logs = [log for log in session_logs if log["errors"]]
-            if error_logs:
-                print(f"Errors encountered: {len(error_logs)}")
-                for log in error_logs[-3:]:
+        stats = self.db_logger.get_session_stats(self.session_id)
+        if stats:
+            print(f"Total logs recorded: {sum(logs for logs, _ in stats.values())}")
+            print(f"Audio capture logs: {stats.get(1, (0, 0))[0]}")
+            print(f"ASR/Translation logs: {stats.get(2, (0, 0))[0]}")
+            print(f"Audio output logs: {stats.get(3, (0, 0))[0]}")
+
+            error_count = sum(errors for _, errors in stats.values())
+            if error_count:
+                print(f"Errors encountered: {error_count}")
+                for log in self.db_logger.get_session_errors(self.session_id):
                     print(f"   {log['timestamp']}: {log['errors']}")
 
         print(f"\nSession ID: {self.session_id}")
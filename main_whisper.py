@@ -1,23 +1,29 @@
 import argparse
-import os
+import functools
+import queue
 import re
 import sys
-import tempfile
+import threading
 import time
 
 # Suppress specific warnings
 import warnings
+from concurrent.futures import Future
 
+import numpy as np
 import sounddevice as sd
 import speech_recognition as sr
 
-from fluentai import LazyModelLoader
 from fluentai.audio_utils import (
-    apply_automatic_gain_control,
-    normalize_audio_rms,
+    prepare_for_whisper,
+    trim_silence,
 )
-from fluentai.transcription import transcribe_long_audio
-from fluentai.tts_engine import synthesize_to_numpy
+from fluentai.transcription import (
+    load_faster_whisper,
+    model_supports_fp16,
+    transcribe_long_audio,
+)
+from fluentai.tts_engine import speak_to_device, synthesize_to_numpy
 from silence_detector import (
     SilenceDetectorIntegration,
     create_silence_detector,
@@ -43,77 +49,13 @@ silence_detector = None
 silence_integration = None
 args = None
 
+# Datos de detectar_idioma y es_texto_latino, construidos una sola vez al
+# importar (frozenset para búsquedas O(1) por palabra/carácter).
+_PALABRA_RE = re.compile(r"\b\w+\b")
 
-# --- 2. DEFINICIÓN DE FUNCIONES ---
-
-
-def es_texto_latino(texto):
-    """
-    Verifica si el texto contiene principalmente caracteres latinos (español/inglés).
-    Retorna False si detecta caracteres de otros alfabetos como griego, cirílico, etc.
-    """
-    # Caracteres latinos básicos + acentos españoles + signos de puntuación
-    caracteres_latinos = set(
-        "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        "áéíóúüñÁÉÍÓÚÜÑ¿¡.,;:!?()[]{}\"'-_ "
-    )
-
-    # Contar caracteres latinos vs no latinos
-    caracteres_texto = set(texto)
-    caracteres_no_latinos = caracteres_texto - caracteres_latinos
-
-    # Si hay más del 20% de caracteres no latinos, probablemente no es español/inglés
-    if len(caracteres_no_latinos) > 0:
-        porcentaje_no_latinos = len(caracteres_no_latinos) / len(caracteres_texto)
-        if porcentaje_no_latinos > 0.2:
-            return False
-
-    return True
-
-
-def validar_idioma_whisper(texto, idioma_detectado):
-    """
-    Valida que el texto transcrito sea consistente con el idioma detectado por Whisper.
-    """
-    # Primero verificar que sea texto latino
-    if not es_texto_latino(texto):
-        return False
-
-    # Mapear idiomas de Whisper a códigos estándar
-    whisper_to_code = {
-        "spanish": "es",
-        "english": "en",
-        "german": "de",
-        "french": "fr",
-        "italian": "it",
-        "portuguese": "pt",
-    }
-
-    # Obtener el código del idioma
-    idioma_codigo = whisper_to_code.get(idioma_detectado, idioma_detectado)
-
-    # En modo auto, solo aceptar español e inglés
-    if auto_detect:
-        if idioma_codigo not in ["es", "en"]:
-            return False
-    else:
-        # En modo manual, verificar que el idioma detectado sea uno de los configurados
-        if idioma_codigo not in [src_lang, tgt_lang]:
-            return False
-
-    return True
-
-
-def detectar_idioma(texto):
-    """
-    Detecta si el texto está en español o inglés usando patrones básicos.
-    """
-    # Primero verificar que sea texto latino
-    if not es_texto_latino(texto):
-        return None  # Retornar None si no es texto latino
-
-    # Palabras comunes en español
-    palabras_espanol = [
+# Palabras comunes en español
+PALABRAS_ESPANOL = frozenset(
+    (
         "el",
         "la",
         "de",
@@ -144,10 +86,12 @@ def detectar_idioma(texto):
         "malo",
         "grande",
         "pequeño",
-    ]
+    )
+)
 
-    # Palabras comunes en inglés
-    palabras_ingles = [
+# Palabras comunes en inglés
+PALABRAS_INGLES = frozenset(
+    (
         "the",
         "and",
         "or",
@@ -177,16 +121,110 @@ def detectar_idioma(texto):
         "bad",
         "big",
         "small",
-    ]
+    )
+)
+
+# Caracteres que solo aparecen en español
+CARACTERES_ESPANOL = frozenset("ñáéíóú¿¡")
+
+# Frases para desempatar cuando el conteo de palabras no decide
+FRASES_ESPANOL = ("hola", "gracias", "por favor", "buenos días")
+FRASES_INGLES = ("hello", "thank you", "please", "good morning")
+
+# Caracteres latinos básicos + acentos españoles + signos de puntuación
+CARACTERES_LATINOS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "áéíóúüñÁÉÍÓÚÜÑ¿¡.,;:!?()[]{}\"'-_ "
+)
+
+# Confianza mínima de Google (es-ES) para no repetir la consulta en en-US
+CONFIANZA_MIN_GOOGLE = 0.75
+
+# Decodificación greedy para frases cortas: el beam search por defecto de
+# MarianMT multiplica el coste del decoder sin mejora apreciable aquí
+TRADUCCION_NUM_BEAMS = 1
+TRADUCCION_MAX_TOKENS = 256
+
+# Recorte de silencio antes de Whisper: por debajo de esta fracción del umbral
+# de escucha un tramo cuenta como silencio, y lo que quede por debajo de
+# DURACION_MIN_VOZ_S se trata como ruido
+RECORTE_UMBRAL_RELATIVO = 0.5
+DURACION_MIN_VOZ_S = 0.3
+
+
+# --- 2. DEFINICIÓN DE FUNCIONES ---
+
+
+def es_texto_latino(texto):
+    """
+    Verifica si el texto contiene principalmente caracteres latinos (español/inglés).
+    Retorna False si detecta caracteres de otros alfabetos como griego, cirílico, etc.
+    """
+    # Contar caracteres latinos vs no latinos
+    caracteres_texto = set(texto)
+    caracteres_no_latinos = caracteres_texto - CARACTERES_LATINOS
+
+    # Si hay más del 20% de caracteres no latinos, probablemente no es español/inglés
+    if len(caracteres_no_latinos) > 0:
+        porcentaje_no_latinos = len(caracteres_no_latinos) / len(caracteres_texto)
+        if porcentaje_no_latinos > 0.2:
+            return False
+
+    return True
+
+
+def validar_idioma_whisper(texto, idioma_detectado):
+    """
+    Valida que el texto transcrito sea consistente con el idioma detectado por Whisper.
+    """
+    # Primero verificar que sea texto latino
+    if not es_texto_latino(texto):
+        return False
+
+    # Mapear idiomas de Whisper a códigos estándar
+    whisper_to_code = {
+        "spanish": "es",
+        "english": "en",
+        "german": "de",
+        "french": "fr",
+        "italian": "it",
+        "portuguese": "pt",
+    }
+
+    # Obtener el código del idioma
+    idioma_codigo = whisper_to_code.get(idioma_detectado, idioma_detectado)
+
+    # En modo auto, solo aceptar español e inglés
+    if auto_detect:
+        if idioma_codigo not in ["es", "en"]:
+            return False
+    else:
+        # En modo manual, verificar que el idioma detectado sea uno de los configurados
+        if idioma_codigo not in [src_lang, tgt_lang]:
+            return False
+
+    return True
+
+
+def detectar_idioma(texto):
+    """
+    Detecta si el texto está en español o inglés usando patrones básicos.
+    """
+    # Primero verificar que sea texto latino
+    if not es_texto_latino(texto):
+        return None  # Retornar None si no es texto latino
 
     texto_lower = texto.lower()
-    palabras_texto = re.findall(r"\b\w+\b", texto_lower)
 
-    puntos_espanol = sum(1 for palabra in palabras_texto if palabra in palabras_espanol)
-    puntos_ingles = sum(1 for palabra in palabras_texto if palabra in palabras_ingles)
+    # Una sola pasada con búsquedas en frozenset
+    puntos_espanol = 0
+    puntos_ingles = 0
+    for palabra in _PALABRA_RE.findall(texto_lower):
+        puntos_espanol += palabra in PALABRAS_ESPANOL
+        puntos_ingles += palabra in PALABRAS_INGLES
 
     # También verificar caracteres específicos del español
-    if any(char in texto_lower for char in ["ñ", "á", "é", "í", "ó", "ú", "¿", "¡"]):
+    if not CARACTERES_ESPANOL.isdisjoint(texto_lower):
         puntos_espanol += 2
 
     if puntos_espanol > puntos_ingles:
@@ -195,68 +233,96 @@ def detectar_idioma(texto):
         return "en"
     else:
         # Si no está claro, intentar detectar por estructura
-        if any(
-            word in texto_lower
-            for word in ["hola", "gracias", "por favor", "buenos días"]
-        ):
+        if any(frase in texto_lower for frase in FRASES_ESPANOL):
             return "es"
-        elif any(
-            word in texto_lower
-            for word in ["hello", "thank you", "please", "good morning"]
-        ):
+        elif any(frase in texto_lower for frase in FRASES_INGLES):
             return "en"
         else:
             return "es"  # Por defecto español
 
 
-def grabar_y_reconocer_con_whisper(max_duration=60):
+def calentar_whisper():
     """
-    Captura audio del micrófono y lo transcribe usando Whisper.
-    Optimizado para 16 kHz sample rate y chunk size mejorado.
+    Pasa un segundo de silencio por Whisper para que la primera frase real no
+    pague la inicialización de kernels/memoria, y compila de paso el
+    preprocesado de audio (numba). Se ejecuta en segundo plano mientras se
+    calibra el micrófono.
     """
-    # Configure microphone with optimized settings for Whisper
-    with sr.Microphone(sample_rate=16000, chunk_size=1024) as source:
-        print("\nDi algo en español o inglés...")
-        # Ajuste más estricto para el ruido ambiental
-        recognizer.adjust_for_ambient_noise(source, duration=1)
-
-        # Configurar umbrales más altos para evitar falsos positivos
-        recognizer.energy_threshold = 4000  # Umbral de energía más alto
-        recognizer.dynamic_energy_threshold = True
-        recognizer.dynamic_energy_adjustment_damping = 0.15
-        recognizer.dynamic_energy_ratio = 1.5
-
-        # Escuchar con timeout y tiempo mínimo de frase
-        try:
-            audio = recognizer.listen(
-                source, timeout=max_duration, phrase_time_limit=max_duration
-            )
-        except sr.WaitTimeoutError:
-            print("No se detectó ningún sonido. Intenta de nuevo.")
-            return None, None
+    try:
+        prepare_for_whisper(b"\0\0" * 160)
+        whisper_model.transcribe(
+            np.zeros(16000, dtype=np.float32),
+            fp16=model_supports_fp16(whisper_model),
+        )
+    except Exception as e:
+        print(f"Aviso: no se pudo precalentar Whisper: {e}")
 
-    # Guardar el audio en un archivo temporal con procesamiento mejorado
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_audio:
-        temp_filename = temp_audio.name
-        with open(temp_filename, "wb") as f:
-            # Get raw audio data
-            audio_data = audio.get_wav_data()
 
-            # Apply audio normalization using RMS for better Whisper recognition
-            print("Aplicando normalización de audio...")
-            normalized_audio = normalize_audio_rms(audio_data, target_rms=0.2)
+def calibrar_microfono(source):
+    """
+    Calibra el reconocedor con el micrófono abierto, una vez por sesión.
+    """
+    # Ajuste más estricto para el ruido ambiental
+    recognizer.adjust_for_ambient_noise(source, duration=1)
+
+    # Configurar umbrales más altos para evitar falsos positivos
+    recognizer.energy_threshold = 4000  # Umbral de energía más alto
+    recognizer.dynamic_energy_threshold = True
+    recognizer.dynamic_energy_adjustment_damping = 0.15
+    recognizer.dynamic_energy_ratio = 1.5
+
+
+def grabar_y_reconocer_con_whisper(source, max_duration=60):
+    """
+    Captura audio del micrófono ya abierto y lo transcribe usando Whisper.
+
+    El stream y la calibración se reutilizan entre frases (ver
+    calibrar_microfono); el umbral dinámico sigue adaptándose al escuchar.
+    """
+    print("\nDi algo en español o inglés...")
+
+    # Escuchar con timeout y tiempo mínimo de frase
+    try:
+        audio = recognizer.listen(
+            source, timeout=max_duration, phrase_time_limit=max_duration
+        )
+    except sr.WaitTimeoutError:
+        print("No se detectó ningún sonido. Intenta de nuevo.")
+        return None, None
+
+    # PCM de 16 bits a 16 kHz en memoria: sin WAV temporal ni re-decodificación
+    audio_data = audio.get_raw_data(convert_rate=16000, convert_width=2)
 
-            # Apply automatic gain control for consistency across microphones
-            print("Aplicando control automático de ganancia...")
-            processed_audio = apply_automatic_gain_control(normalized_audio)
+    # listen() conserva silencio antes y después de la frase (pause_threshold);
+    # recortarlo acorta la entrada que Whisper tiene que decodificar
+    audio_data = trim_silence(
+        audio_data,
+        16000,
+        threshold=recognizer.energy_threshold * RECORTE_UMBRAL_RELATIVO,
+    )
+    if len(audio_data) < DURACION_MIN_VOZ_S * 16000 * 2:
+        print("Solo se detectó ruido. Intenta de nuevo.")
+        return None, None
 
-            f.write(processed_audio)
+    # Normalización RMS + control automático de ganancia en una sola pasada
+    print("Aplicando normalización y control automático de ganancia...")
+    pcm = prepare_for_whisper(audio_data, target_rms=0.2)
 
     try:
         print("Reconociendo tu voz con Whisper...")
 
         # Transcribir usando Whisper con procesamiento por segmentos
-        result = transcribe_long_audio(whisper_model, temp_filename)
+        # FP16 solo en GPU; en CPU Whisper avisaría y volvería a FP32 cada vez.
+        # Sin timestamps: aquí solo interesa el texto, y así el decoder se
+        # ahorra los tokens de tiempo y sus reglas en cada paso.
+        result = transcribe_long_audio(
+            whisper_model,
+            pcm,
+            transcribe_options={
+                "fp16": model_supports_fp16(whisper_model),
+                "without_timestamps": True,
+            },
+        )
         texto_transcrito = result["text"].strip()
         idioma_detectado = result["language"]
 
@@ -287,12 +353,13 @@ def grabar_y_reconocer_con_whisper(max_duration=60):
                 return None, None
 
         # Validar que el texto tenga sentido y no sea demasiado corto
-        if len(texto_transcrito) < 2 or len(texto_transcrito.split()) < 1:
+        palabras = texto_transcrito.split()
+        if len(texto_transcrito) < 2 or not palabras:
             print("Texto demasiado corto o sin contenido. Intenta de nuevo.")
             return None, None
 
         # Filtrar texto que parece ser solo ruido
-        if all(len(palabra) <= 2 for palabra in texto_transcrito.split()):
+        if max(map(len, palabras)) <= 2:
             print("Texto parece ser ruido. Intenta hablar más claro.")
             return None, None
 
@@ -304,12 +371,24 @@ def grabar_y_reconocer_con_whisper(max_duration=60):
         print("Intentando con reconocimiento de Google como fallback...")
         return grabar_y_reconocer_fallback(audio)
 
-    finally:
-        # Limpiar el archivo temporal
+
+def _en_segundo_plano(funcion, *args, **kwargs):
+    """
+    Ejecuta funcion en un hilo daemon y devuelve un Future con su resultado.
+
+    A diferencia de un ThreadPoolExecutor, el hilo no retrasa la salida del
+    programa si su respuesta ya no se necesita.
+    """
+    futuro = Future()
+
+    def tarea():
         try:
-            os.unlink(temp_filename)
-        except Exception:
-            pass
+            futuro.set_result(funcion(*args, **kwargs))
+        except BaseException as e:
+            futuro.set_exception(e)
+
+    threading.Thread(target=tarea, name="google-en", daemon=True).start()
+    return futuro
 
 
 def grabar_y_reconocer_fallback(audio):
@@ -318,14 +397,37 @@ def grabar_y_reconocer_fallback(audio):
     """
     try:
         print("Usando Google Speech Recognition como fallback...")
-        texto_es = recognizer.recognize_google(audio, language="es-ES")  # type: ignore
+        # La consulta en-US se envía siempre, en paralelo con la es-ES; si el
+        # español sale claro, su respuesta se descarta sin esperarla
+        consulta_en = _en_segundo_plano(
+            recognizer.recognize_google,  # type: ignore
+            audio,
+            language="en-US",
+        )
+        # show_all devuelve las alternativas con su confianza ([] si no entendió)
+        resultado_es = recognizer.recognize_google(  # type: ignore
+            audio, language="es-ES", show_all=True
+        )
+        if not isinstance(resultado_es, dict) or not resultado_es.get("alternative"):
+            raise sr.UnknownValueError()
+        mejor_es = resultado_es["alternative"][0]
+        texto_es = mejor_es["transcript"]
+        idioma_detectado_es = detectar_idioma(texto_es)
+
+        # Español claro y con buena confianza: no hace falta esperar la
+        # respuesta en inglés.
+        if (
+            idioma_detectado_es == "es"
+            and mejor_es.get("confidence", 0.0) >= CONFIANZA_MIN_GOOGLE
+        ):
+            print(f"Texto reconocido con fallback (es): '{texto_es}'")
+            return texto_es, "es"
 
         # Intentar también en inglés
         try:
-            texto_en = recognizer.recognize_google(audio, language="en-US")  # type: ignore
+            texto_en = consulta_en.result()
 
             # Detectar cuál es más probable basado en el contenido
-            idioma_detectado_es = detectar_idioma(texto_es)
             idioma_detectado_en = detectar_idioma(texto_en)
 
             # Verificar si alguno de los idiomas es None (texto no latino)
@@ -347,12 +449,12 @@ def grabar_y_reconocer_fallback(audio):
             else:
                 texto_final, idioma_final = texto_en, "en"
 
-        except Exception:
-            idioma_fallback = detectar_idioma(texto_es)
-            if idioma_fallback is None:
+        except (sr.UnknownValueError, sr.RequestError):
+            # Sin resultado en inglés: quedarse con la transcripción en español
+            if idioma_detectado_es is None:
                 print("Texto no reconocido como español o inglés.")
                 return None, None
-            texto_final, idioma_final = texto_es, idioma_fallback
+            texto_final, idioma_final = texto_es, idioma_detectado_es
 
         print(f"Texto reconocido con fallback ({idioma_final}): '{texto_final}'")
         return texto_final, idioma_final
@@ -399,7 +501,11 @@ def traducir_texto(texto_a_traducir, idioma_origen):
             return None, None
 
         print(f"Traduciendo de {idioma_origen} a {idioma_destino}...")
-        resultado = translator(texto_a_traducir)
+        resultado = translator(
+            texto_a_traducir,
+            num_beams=TRADUCCION_NUM_BEAMS,
+            max_new_tokens=TRADUCCION_MAX_TOKENS,
+        )
         texto_traducido = resultado[0]["translation_text"]
         print(f"Texto traducido: '{texto_traducido}'")
         return texto_traducido, idioma_destino
@@ -409,17 +515,34 @@ def traducir_texto(texto_a_traducir, idioma_origen):
         return None, None
 
 
+@functools.lru_cache(maxsize=128)
+def _sintetizar_cached(texto, idioma):
+    """Sintetiza cada (texto, idioma) una sola vez; frases repetidas como
+    "sí"/"ok" reutilizan las muestras."""
+    return synthesize_to_numpy(texto, idioma, sample_rate=44100)
+
+
 def hablar_texto(texto_a_hablar, idioma="en"):
     """
     Sintetiza y reproduce texto con la TTS unificada.
+
+    En macOS `say` reproduce mientras sintetiza (sin archivo intermedio);
+    en otras plataformas, o si falla, se renderiza a numpy y se reproduce.
+    La llamada bloquea hasta terminar para que el micrófono no capte la
+    propia traducción.
     """
     if not texto_a_hablar:
         return
 
+    if speak_to_device(texto_a_hablar, idioma):
+        return
+
     print("Generando audio...")
     try:
-        samples = synthesize_to_numpy(texto_a_hablar, idioma, sample_rate=44100)
+        samples = _sintetizar_cached(texto_a_hablar, idioma)
         if samples.size == 0:
+            # No guardar una síntesis fallida en la caché.
+            _sintetizar_cached.cache_clear()
             print("TTS no generó muestras.")
             return
         sd.play(samples, samplerate=44100)
@@ -428,6 +551,21 @@ def hablar_texto(texto_a_hablar, idioma="en"):
         print(f"Ocurrió un error al reproducir el audio: {e}")
 
 
+def _hilo_traduccion(entrada, salida):
+    """Traduce lo que llega por *entrada* y lo pasa a *salida* (modo --pipeline)."""
+    while (item := entrada.get()) is not None:
+        texto_traducido, idioma_destino = traducir_texto(*item)
+        if texto_traducido is not None:
+            salida.put((texto_traducido, idioma_destino))
+    salida.put(None)
+
+
+def _hilo_voz(entrada):
+    """Reproduce las traducciones de *entrada* en orden (modo --pipeline)."""
+    while (item := entrada.get()) is not None:
+        hablar_texto(*item)
+
+
 def parse_cli_args():
     """
     Parse command line arguments for the translator.
@@ -479,6 +617,12 @@ Examples:
         help="Whisper model size (default: base)",
     )
 
+    parser.add_argument(
+        "--faster-whisper",
+        action="store_true",
+        help="Run Whisper on the faster-whisper (CTranslate2) int8 backend if installed",
+    )
+
     parser.add_argument(
         "--cache_dir",
         type=str,
@@ -506,6 +650,13 @@ Examples:
         help="Maximum recording duration in seconds (default: 60)",
     )
 
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Translate and speak in background threads while listening for the "
+        "next phrase (use with headphones so the mic does not hear the output)",
+    )
+
     # Silence detection parameters
     parser.add_argument(
         "--silence-detection",
@@ -585,8 +736,11 @@ def init_models(args):
     tgt_lang = args.tgt_lang
     auto_detect = args.auto
 
-    # Initialize LazyModelLoader
+    # Initialize LazyModelLoader (importado aquí: arrastra whisper/torch y
+    # así --help y los errores de argumentos responden al instante)
     print("Initializing LazyModelLoader...")
+    from fluentai import LazyModelLoader
+
     model_loader = LazyModelLoader(cache_dir=args.cache_dir)
 
     # Progress callback for model loading with timing
@@ -613,7 +767,13 @@ def init_models(args):
     # Initialize Whisper model
     print(f"Loading Whisper model ({args.whisper_model})...", end="", flush=True)
     start_time = time.time()
-    whisper_model = model_loader.get_whisper_model(args.whisper_model)
+    whisper_model = None
+    if args.faster_whisper:
+        whisper_model = load_faster_whisper(args.whisper_model)
+        if whisper_model is None:
+            print("faster-whisper not installed, using openai-whisper...", end="")
+    if whisper_model is None:
+        whisper_model = model_loader.get_whisper_model(args.whisper_model)
 
     if whisper_model is None:
         print("error")
@@ -748,29 +908,70 @@ if __name__ == "__main__":
 
     print("Presiona Ctrl+C para salir.")
 
+    # Con --pipeline la traducción y la voz corren en hilos propios, de modo
+    # que la siguiente frase se graba y transcribe mientras tanto.
+    cola_traduccion = cola_voz = None
+    hilos = []
+    if args.pipeline:
+        cola_traduccion = queue.Queue(maxsize=2)
+        cola_voz = queue.Queue(maxsize=2)
+        hilos = [
+            threading.Thread(
+                target=_hilo_traduccion,
+                args=(cola_traduccion, cola_voz),
+                name="traduccion",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=_hilo_voz, args=(cola_voz,), name="voz", daemon=True
+            ),
+        ]
+        for hilo in hilos:
+            hilo.start()
+
     try:
-        while True:
-            # Paso 1: Escuchar y transcribir con Whisper
-            texto_original, idioma_origen = grabar_y_reconocer_con_whisper(
-                args.max_duration
+        # Micrófono abierto una sola vez para toda la sesión, optimizado para
+        # Whisper (16 kHz, chunk size mejorado)
+        with sr.Microphone(sample_rate=16000, chunk_size=1024) as source:
+            # El precalentamiento de Whisper se solapa con la calibración (1 s)
+            calentamiento = threading.Thread(
+                target=calentar_whisper, name="calentamiento", daemon=True
             )
+            calentamiento.start()
+            calibrar_microfono(source)
+            calentamiento.join()
+            while True:
+                # Paso 1: Escuchar y transcribir con Whisper
+                texto_original, idioma_origen = grabar_y_reconocer_con_whisper(
+                    source, args.max_duration
+                )
 
-            if texto_original is None:
-                continue
+                if texto_original is None:
+                    continue
 
-            # Paso 2: Traducir el texto
-            texto_traducido, idioma_destino = traducir_texto(
-                texto_original, idioma_origen
-            )
+                if cola_traduccion is not None:
+                    cola_traduccion.put((texto_original, idioma_origen))
+                    continue
+
+                # Paso 2: Traducir el texto
+                texto_traducido, idioma_destino = traducir_texto(
+                    texto_original, idioma_origen
+                )
 
-            if texto_traducido is None:
-                continue
+                if texto_traducido is None:
+                    continue
 
-            # Paso 3: Hablar la traducción
-            hablar_texto(texto_traducido, idioma_destino)
+                # Paso 3: Hablar la traducción
+                hablar_texto(texto_traducido, idioma_destino)
 
     except KeyboardInterrupt:
         print("\n¡Adiós! Saliendo del programa.")
     finally:
+        if cola_traduccion is not None:
+            # Un centinela cierra la cadena: traducción lo reenvía a la voz.
+            # Los hilos son daemon, así que un Ctrl+C extra no queda colgado.
+            cola_traduccion.put(None)
+            for hilo in hilos:
+                hilo.join()
         if model_loader:
             model_loader.shutdown()
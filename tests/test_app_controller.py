@@ -17,7 +17,14 @@ class FakeLoader:
     def get_model(self, src, dst):
         if not self.available:
             return None
-        return lambda text, **kwargs: [{"translation_text": f"<{src}->{dst}> {text}"}]
+
+        # Like an HF translation pipeline: a list in, one result per item out.
+        def translate(texts, **kwargs):
+            if isinstance(texts, str):
+                texts = [texts]
+            return [{"translation_text": f"<{src}->{dst}> {t}"} for t in texts]
+
+        return translate
 
 
 def test_translate_returns_text():
@@ -32,12 +39,30 @@ def test_translate_returns_none_when_no_model():
 
 def test_translate_handles_multiple_sentences():
     # Each sentence is translated separately (so Marian's max_length can't
-    # truncate the tail), then rejoined. The fake translator tags each call.
+    # truncate the tail), then rejoined. The fake translator tags each item.
     ctrl = TranslationController(FakeLoader())
     out = ctrl.translate("Hello there. How are you? Nice to meet you.", "en", "fr")
     assert out.count("<en->fr>") == 3  # three sentences, three translations
 
 
+def test_translate_batches_sentences_in_one_call():
+    calls = []
+
+    class CountingLoader:
+        def get_model(self, src, dst):
+            def translate(texts, **kwargs):
+                calls.append((texts, kwargs))
+                return [{"translation_text": t.upper()} for t in texts]
+
+            return translate
+
+    ctrl = TranslationController(CountingLoader())
+    assert ctrl.translate("Uno. Dos. Tres.", "es", "en") == "UNO. DOS. TRES."
+    assert len(calls) == 1
+    assert calls[0][0] == ["Uno.", "Dos.", "Tres."]
+    assert calls[0][1]["batch_size"] == 3
+
+
 def test_split_sentences():
     split = TranslationController._split_sentences
     assert split("One. Two! Three?") == ["One.", "Two!", "Three?"]
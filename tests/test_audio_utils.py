@@ -4,12 +4,19 @@ import os
 import sys
 
 import numpy as np
+import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from fluentai import audio_utils  # noqa: E402
 from fluentai.audio_utils import (  # noqa: E402
+    _prepare_jit,
+    _prepare_kernel,
     apply_automatic_gain_control,
     normalize_audio_rms,
+    prepare_for_whisper,
+    rms_int16,
+    trim_silence,
 )
 
 
@@ -61,3 +68,72 @@ def test_agc_preserves_length_and_stays_in_range():
 def test_empty_input_is_handled():
     assert normalize_audio_rms(b"") == b""
     assert apply_automatic_gain_control(b"") == b""
+
+
+def test_rms_int16():
+    assert rms_int16(np.zeros(0, dtype=np.int16)) == 0.0
+    assert rms_int16(np.full(480, 1000, dtype=np.int16)) == 1000.0
+    square = np.tile(np.array([3000, -3000], dtype=np.int16), 240)
+    assert rms_int16(square) == 3000.0
+
+
+def test_trim_silence_keeps_voiced_region_with_margin():
+    sr = 16000
+    samples = np.zeros(sr * 3, dtype=np.int16)
+    samples[sr : 2 * sr] = 8000  # one second of "speech" in the middle
+    out = np.frombuffer(
+        trim_silence(samples.tobytes(), sr, threshold=1000, pad_ms=100),
+        dtype=np.int16,
+    )
+    assert out.size == sr + 2 * (sr // 10)
+    assert out.max() == 8000
+
+
+def test_trim_silence_all_quiet_returns_empty():
+    quiet = _pcm_bytes(np.full(16000, 10))
+    assert trim_silence(quiet, 16000, threshold=1000) == b""
+    assert trim_silence(b"", 16000, threshold=1000) == b""
+
+
+def test_prepare_for_whisper_matches_two_step_pipeline():
+    rng = np.random.default_rng(0)
+    for amplitude in (50, 3000, 30000):
+        pcm = _pcm_bytes(rng.normal(0, amplitude, 8000).clip(-32767, 32767))
+        two_step = apply_automatic_gain_control(normalize_audio_rms(pcm))
+        expected = np.frombuffer(two_step, dtype=np.int16) / 32768.0
+        out = prepare_for_whisper(pcm)
+        assert out.dtype == np.float32
+        assert np.allclose(out, expected, atol=2 / 32768)
+
+
+def test_prepare_for_whisper_silence_and_empty():
+    assert not prepare_for_whisper(_pcm_bytes(np.zeros(100))).any()
+    assert prepare_for_whisper(b"").size == 0
+
+
+def test_prepare_kernel_matches_numpy_path():
+    rng = np.random.default_rng(1)
+    for amplitude in (0, 50, 3000, 30000):
+        samples = rng.normal(0, amplitude + 1e-9, 2000).clip(-32767, 32767)
+        pcm = _pcm_bytes(samples)
+        two_step = apply_automatic_gain_control(normalize_audio_rms(pcm))
+        expected = np.frombuffer(two_step, dtype=np.int16) / 32768.0
+        out = _prepare_kernel(np.frombuffer(pcm, dtype=np.int16), 0.2)
+        assert out.dtype == np.float32
+        assert np.allclose(out, expected, atol=2 / 32768)
+
+
+def test_prepare_jit_matches_numpy_path(monkeypatch):
+    pytest.importorskip("numba")
+    kernel = _prepare_jit()
+    # Force prepare_for_whisper onto its NumPy implementation for reference.
+    monkeypatch.setattr(audio_utils, "_prepare_jit", lambda: None)
+    rng = np.random.default_rng(2)
+    for amplitude in (0, 50, 3000, 30000):
+        samples = rng.normal(0, amplitude + 1e-9, 2000).clip(-32767, 32767)
+        pcm = _pcm_bytes(samples)
+        expected = prepare_for_whisper(pcm)
+        out = kernel(np.frombuffer(pcm, dtype=np.int16), 0.2)
+        assert out.dtype == np.float32
+        # fastmath may round differently: allow one LSB.
+        assert np.allclose(out, expected, rtol=0, atol=1 / 32768)
@@ -0,0 +1,119 @@
+"""Tests for the buffered DuckDB logger, against a throwaway database file."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("duckdb")
+
+from fluentai.database_logger import (  # noqa: E402
+    DatabaseLogger,
+    generate_session_id,
+)
+
+
+@pytest.fixture
+def logger(tmp_path):
+    db_logger = DatabaseLogger(db_path=str(tmp_path / "t.duckdb"))
+    yield db_logger
+    db_logger.close()
+
+
+def log_summary(db_logger, session_id, message="hola"):
+    db_logger.log_complete_translation(
+        session_id=session_id,
+        input_language="es",
+        output_language="en",
+        input_channel="mic",
+        output_channel="speakers",
+        full_message_input=message,
+        full_message_translated="hello",
+        total_segments_audio=1,
+        total_segments_asr=1,
+        total_segments_output=1,
+        model_used="opus-mt-es-en",
+        total_latency_ms=120.0,
+    )
+
+
+def test_rows_are_written_on_flush(logger):
+    session_id = generate_session_id()
+    logger.log_audio_capture(session_id, "mic", "first", 12.5, metadata={"rate": 16000})
+    logger.log_audio_capture(session_id, "mic", "second", 8.0)
+    log_summary(logger, session_id)
+    logger.flush()
+
+    logs = logger.get_session_logs(session_id)
+    assert [log["message"] for log in logs] == ["first", "second"]
+    assert logger.get_translation_summary(session_id)["full_message_input"] == "hola"
+
+
+def test_bulk_commits_its_rows(logger):
+    session_id = generate_session_id()
+    with logger.bulk():
+        logger.log_audio_capture(session_id, "mic", "a", 1.0)
+        logger.log_audio_playback(session_id, "speakers", "b", 2.0)
+        log_summary(logger, session_id)
+
+    assert len(logger.get_session_logs(session_id)) == 2
+    assert logger.get_translation_summary(session_id) is not None
+
+
+def test_bulk_rolls_back_when_the_block_raises(logger):
+    session_id = generate_session_id()
+    with pytest.raises(RuntimeError):
+        with logger.bulk():
+            logger.log_audio_capture(session_id, "mic", "a", 1.0)
+            log_summary(logger, session_id)  # written inside the transaction
+            raise RuntimeError("boom")
+
+    assert logger.get_session_logs(session_id) == []
+    assert logger.get_translation_summary(session_id) is None
+
+
+def test_bad_row_is_dropped_and_the_rest_of_the_batch_lands(logger):
+    session_id = generate_session_id()
+    logger.log_audio_capture(session_id, "mic", "before", 1.0)
+    logger.log_audio_capture("not-a-uuid", "mic", "bad", 1.0)
+    logger.log_audio_capture(session_id, "mic", "after", 1.0)
+    log_summary(logger, session_id)
+    logger.flush()
+
+    logs = logger.get_session_logs(session_id)
+    assert [log["message"] for log in logs] == ["before", "after"]
+    assert logger.get_translation_summary(session_id) is not None
+
+
+def test_read_helpers_return_text_session_ids(logger):
+    session_id = generate_session_id()
+    logger.log_audio_capture(session_id, "mic", "a", 1.0)
+    log_summary(logger, session_id)
+
+    assert logger.get_session_logs(session_id)[0]["session_id"] == session_id
+    assert logger.get_translation_summary(session_id)["session_id"] == session_id
+    assert logger.get_recent_translations(limit=1)[0]["session_id"] == session_id
+
+
+def test_session_stats_errors_and_activity(logger):
+    session_id = generate_session_id()
+    other_id = generate_session_id()
+    logger.log_audio_capture(session_id, "mic", "one", 1.0)
+    logger.log_audio_capture(session_id, "mic", "two", 1.0)
+    logger.log_asr_translation(session_id, "es", "en", "hola", "hello", "m", 5.0)
+    logger.log_audio_playback(session_id, "speakers", "out", 3.0, errors=["boom"])
+    logger.log_audio_capture(other_id, "mic", "elsewhere", 1.0)
+
+    assert logger.get_session_stats(session_id) == {1: (2, 0), 2: (1, 0), 3: (1, 1)}
+
+    errors = logger.get_session_errors(session_id)
+    assert [(e["thread_id"], e["errors"]) for e in errors] == [(3, ["boom"])]
+
+    total, recent = logger.get_session_activity(session_id, limit=2)
+    assert total == 4
+    assert [(row["thread_id"], row["message"]) for row in recent] == [
+        (2, "Original: hola | Translated: hello"),
+        (3, "out"),
+    ]
@@ -19,7 +19,7 @@ from unittest.mock import Mock, patch
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fluentai.model_loader import LazyModelLoader
+from fluentai.model_loader import CTranslate2Translator, LazyModelLoader
 
 
 class TestLazyModelLoaderMocking(unittest.TestCase):
@@ -327,6 +327,53 @@ class TestLazyModelLoaderMocking(unittest.TestCase):
         self.assertEqual(len(self.loader._translation_models), 0)
         self.assertEqual(len(self.loader._whisper_models), 0)
 
+    @patch("fluentai.model_loader.pipeline")
+    def test_ctranslate2_export_without_package_uses_pipeline(self, mock_pipeline):
+        """An exported model dir is ignored when ctranslate2 is unavailable."""
+        mock_pipeline.return_value = Mock()
+        os.makedirs(os.path.join(self.test_cache_dir, "ct2", "es-en"))
+
+        with patch.dict(sys.modules, {"ctranslate2": None}):
+            model = self.loader.get_model("es", "en")
+
+        self.assertIs(model, mock_pipeline.return_value)
+
+
+class TestCTranslate2Translator(unittest.TestCase):
+    """Test the pipeline-shaped wrapper around a CTranslate2 translator."""
+
+    def test_returns_pipeline_style_results(self):
+        tokenizer = Mock()
+        tokenizer.encode.side_effect = lambda text: [len(text)]
+        tokenizer.convert_ids_to_tokens.side_effect = lambda ids: ["▁tok"]
+        tokenizer.convert_tokens_to_ids.side_effect = lambda tokens: [1]
+        tokenizer.decode.return_value = "hello"
+        translator = Mock()
+        translator.translate_batch.return_value = [
+            Mock(hypotheses=[["▁hello"]]),
+            Mock(hypotheses=[["▁hello"]]),
+        ]
+
+        wrapper = CTranslate2Translator(translator, tokenizer)
+        results = wrapper(["hola", "hola"], max_length=64, do_sample=False)
+
+        self.assertEqual(results, [{"translation_text": "hello"}] * 2)
+        _, kwargs = translator.translate_batch.call_args
+        self.assertEqual(kwargs["beam_size"], 1)
+        self.assertEqual(kwargs["max_decoding_length"], 64)
+
+    def test_accepts_a_single_string(self):
+        tokenizer = Mock()
+        tokenizer.decode.return_value = "hello"
+        translator = Mock()
+        translator.translate_batch.return_value = [Mock(hypotheses=[["▁hello"]])]
+
+        results = CTranslate2Translator(translator, tokenizer)("hola")
+
+        self.assertEqual(results, [{"translation_text": "hello"}])
+        batch = translator.translate_batch.call_args[0][0]
+        self.assertEqual(len(batch), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
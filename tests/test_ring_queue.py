@@ -0,0 +1,85 @@
+"""Tests for the SPSC RingQueue used between the pipeline threads."""
+
+import os
+import queue
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fluentai.ring_queue import RingQueue  # noqa: E402
+
+
+def test_fifo_order_and_size():
+    q = RingQueue(maxsize=3)
+    assert q.empty()
+    q.put("a")
+    q.put_nowait("b")
+    assert q.qsize() == 2
+    assert q.get() == "a"
+    assert q.get_nowait() == "b"
+    assert q.empty()
+
+
+def test_full_queue_raises_when_not_blocking():
+    q = RingQueue(maxsize=1)
+    q.put(1)
+    with pytest.raises(queue.Full):
+        q.put_nowait(2)
+    with pytest.raises(queue.Full):
+        q.put(2, block=False, timeout=10)  # must not block for the timeout
+
+
+def test_full_queue_raises_after_timeout():
+    q = RingQueue(maxsize=1)
+    q.put(1)
+    with pytest.raises(queue.Full):
+        q.put(2, timeout=0.01)
+    assert q.qsize() == 1
+
+
+def test_blocked_producer_is_woken_by_consumer():
+    q = RingQueue(maxsize=1)
+    q.put("a")
+    producer = threading.Thread(target=q.put, args=("b",), kwargs={"timeout": 5})
+    producer.start()
+    assert q.get(timeout=5) == "a"
+    producer.join(timeout=5)
+    assert not producer.is_alive()
+    assert q.get_nowait() == "b"
+
+
+def test_empty_queue_raises_after_timeout():
+    q = RingQueue(maxsize=1)
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.01)
+
+
+def test_callbacks_receive_new_size():
+    puts, gets = [], []
+    q = RingQueue(maxsize=4, on_put=puts.append, on_get=gets.append)
+    q.put("x")
+    q.put("y")
+    q.get()
+    assert puts == [1, 2]
+    assert gets == [1]
+
+
+def test_blocked_consumer_is_woken_by_producer():
+    q = RingQueue(maxsize=2)
+    received = []
+
+    def consume():
+        for _ in range(200):
+            received.append(q.get(timeout=5))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    for item in range(200):
+        q.put(item, timeout=5)
+    consumer.join(timeout=5)
+    assert received == list(range(200))
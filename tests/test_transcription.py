@@ -10,7 +10,12 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fluentai.transcription import transcribe_long_audio  # noqa: E402
+from fluentai.transcription import (  # noqa: E402
+    _drop_repeated_tail,
+    _FasterWhisperModel,
+    model_supports_fp16,
+    transcribe_long_audio,
+)
 
 TEST_WAV = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
@@ -68,3 +73,183 @@ def test_min_duration_skip_keeps_forced_language():
     result = transcribe_long_audio(model, TEST_WAV, language="fr", min_duration=9999)
     assert result["language"] == "fr"
     assert model.calls == []
+
+
+def test_chunked_autodetect_reuses_first_chunk_language():
+    model = FakeModel()
+    result = transcribe_long_audio(model, TEST_WAV, chunk_length=0.5)
+    # 2s clip in 0.5s chunks: one call per chunk, no extra whole-file pass.
+    # Chunks are handed over as in-memory audio, not re-encoded temp files.
+    assert len(model.calls) == 4
+    assert all(not isinstance(audio, str) for audio, _ in model.calls)
+    assert result["language"] == "es"
+    assert result["text"] == "hola hola hola hola"
+
+
+def test_model_supports_fp16_follows_model_device():
+    class Device:
+        def __init__(self, type):
+            self.type = type
+
+    cuda_model = FakeModel()
+    cuda_model.device = Device("cuda")
+    cpu_model = FakeModel()
+    cpu_model.device = Device("cpu")
+
+    assert model_supports_fp16(cuda_model)
+    assert not model_supports_fp16(cpu_model)
+    assert not model_supports_fp16(FakeModel())
+
+
+def test_chunks_disable_conditioning_on_previous_text():
+    model = FakeModel()
+    transcribe_long_audio(model, TEST_WAV, language="es", chunk_length=0.5)
+    for _, kwargs in model.calls:
+        assert kwargs["language"] == "es"
+        assert kwargs["condition_on_previous_text"] is False
+
+
+def test_repeated_tail_is_collapsed():
+    assert _drop_repeated_tail("hola que tal que tal que tal") == "hola que tal"
+    assert _drop_repeated_tail("no no no") == "no"
+    assert _drop_repeated_tail("que tal que tal") == "que tal que tal"
+
+
+def test_faster_whisper_adapter_returns_whisper_style_result():
+    class Segment:
+        def __init__(self, start, end, text):
+            self.start, self.end, self.text = start, end, text
+
+    class Info:
+        language = "es"
+
+    class FakeFasterModel:
+        def __init__(self):
+            self.kwargs = None
+
+        def transcribe(self, audio, **kwargs):
+            self.kwargs = kwargs
+            return iter(
+                [Segment(0.0, 1.0, " hola"), Segment(1.0, 2.0, " mundo")]
+            ), Info()
+
+    fake = FakeFasterModel()
+    result = _FasterWhisperModel(fake).transcribe("x.wav", language="es", fp16=False)
+
+    assert result["text"] == " hola mundo"
+    assert result["language"] == "es"
+    assert [seg["end"] for seg in result["segments"]] == [1.0, 2.0]
+    assert "fp16" not in fake.kwargs
+    assert fake.kwargs["beam_size"] == 1
+
+
+def test_in_memory_array_is_transcribed_without_decoding():
+    import numpy as np
+
+    pcm = np.zeros(16000, dtype=np.float32)
+    model = FakeModel()
+    transcribe_long_audio(model, pcm, language="es")
+    assert len(model.calls) == 1
+    assert model.calls[0][0] is pcm
+
+
+def test_chunks_inherit_fp16_option():
+    model = FakeModel()
+    transcribe_long_audio(
+        model, TEST_WAV, chunk_length=0.5, transcribe_options={"fp16": False}
+    )
+    assert model.calls
+    for _, kwargs in model.calls:
+        assert kwargs["fp16"] is False
+
+
+def test_parallel_chunks_keep_their_order():
+    import time
+
+    import numpy as np
+
+    class ParallelModel:
+        num_workers = 4
+
+        def transcribe(self, audio, **kwargs):
+            index = int(audio[0])
+            time.sleep(0.01 * (4 - index))  # later chunks finish first
+            return {"text": str(index), "language": "es", "segments": []}
+
+    pcm = np.repeat(np.arange(4, dtype=np.float32), 16000)
+    result = transcribe_long_audio(ParallelModel(), pcm, chunk_length=1)
+    assert result["text"] == "0 1 2 3"
+
+
+def test_batched_decode_keeps_order_and_drops_silent_chunks(monkeypatch):
+    import types
+
+    import numpy as np
+
+    import fluentai.transcription as transcription
+
+    options_seen, batch_sizes = [], []
+    # (no_speech_prob, avg_logprob): chunk 3 is silence, chunk 5 only looks
+    # like it (confident enough to keep).
+    scores = {3: (0.9, -2.0), 5: (0.9, -0.5)}
+
+    def decode(model, mels, options):
+        batch_sizes.append(len(mels))
+        results = []
+        for mel in mels:
+            index = int(mel[0])
+            no_speech, logprob = scores.get(index, (0.0, -0.1))
+            results.append(
+                types.SimpleNamespace(
+                    text=str(index),
+                    language="en",
+                    no_speech_prob=no_speech,
+                    avg_logprob=logprob,
+                )
+            )
+        return results
+
+    def decoding_options(**kwargs):
+        options_seen.append(kwargs)
+        return kwargs
+
+    whisper = types.ModuleType("whisper")
+    whisper.DecodingOptions = decoding_options
+    whisper.decode = decode
+    whisper.pad_or_trim = lambda chunk: chunk
+    whisper.log_mel_spectrogram = lambda audio, n_mels, device=None: audio
+    torch = types.ModuleType("torch")
+    torch.stack = list
+    monkeypatch.setitem(sys.modules, "whisper", whisper)
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+    class BatchedModel:
+        dims = types.SimpleNamespace(n_mels=80)
+        device = types.SimpleNamespace(type="cpu")
+        decode = None  # marks an openai-whisper model
+
+        def transcribe(self, audio, **kwargs):
+            raise AssertionError("chunks must go through whisper.decode")
+
+    chunk_count = transcription._CHUNK_BATCH_SIZE + 2
+    pcm = np.repeat(np.arange(chunk_count, dtype=np.float32), 16000)
+    result = transcribe_long_audio(
+        BatchedModel(),
+        pcm,
+        language="en",
+        chunk_length=1,
+        transcribe_options={"fp16": False},
+    )
+
+    expected = [str(i) for i in range(chunk_count) if i != 3]
+    assert result["text"].split() == expected
+    assert result["language"] == "en"
+    assert batch_sizes == [transcription._CHUNK_BATCH_SIZE, 2]
+    assert options_seen == [
+        {
+            "language": "en",
+            "temperature": 0.0,
+            "without_timestamps": True,
+            "fp16": False,
+        }
+    ]